@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import datetime as dt
 import logging
-import typing
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
@@ -27,16 +29,20 @@ from pyairios.properties import AiriosDeviceProperty
 
 from .const import (
     CONF_FETCH_RESULT_STATUS,
+    CONF_SERIAL_LOW_LATENCY,
+    CONF_STALE_GRACE,
     DEFAULT_FETCH_RESULT_STATUS,
     DEFAULT_NAME,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SERIAL_LOW_LATENCY,
+    DEFAULT_STALE_GRACE,
     DOMAIN,
     BridgeType,
 )
 from .coordinator import AiriosDataUpdateCoordinator
 from .services import async_setup_services
 
-if typing.TYPE_CHECKING:
+if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.typing import ConfigType
     from pyairios.constants import ProductId
@@ -82,32 +88,61 @@ def _get_transport(entry: AiriosConfigEntry) -> AiriosBaseTransport:
     return transport
 
 
-def _get_bridge_data(data: AiriosDeviceData) -> tuple[int, ProductId, str, int]:
-    if AiriosDeviceProperty.RF_ADDRESS not in data:
-        msg = "Failed to get bridge RF address"
-        raise ConfigEntryNotReady(msg)
-    bridge_rf_address = data[AiriosDeviceProperty.RF_ADDRESS].value
-
-    if AiriosDeviceProperty.PRODUCT_ID not in data:
-        msg = "Failed to get bridge product ID"
-        raise ConfigEntryNotReady(msg)
-    product_id = data[AiriosDeviceProperty.PRODUCT_ID].value
-
-    if AiriosDeviceProperty.PRODUCT_NAME not in data:
-        msg = "Failed to get bridge product name"
-        raise ConfigEntryNotReady(msg)
-    product_name = data[AiriosDeviceProperty.PRODUCT_NAME].value
-
-    if AiriosDeviceProperty.SOFTWARE_VERSION not in data:
-        msg = "Failed to get bridge software version"
-        raise ConfigEntryNotReady(msg)
-    sw_version = data[AiriosDeviceProperty.SOFTWARE_VERSION].value
+_REQUIRED_BRIDGE_PROPERTIES: tuple[tuple[AiriosDeviceProperty, str], ...] = (
+    (AiriosDeviceProperty.RF_ADDRESS, "RF address"),
+    (AiriosDeviceProperty.PRODUCT_ID, "product ID"),
+    (AiriosDeviceProperty.PRODUCT_NAME, "product name"),
+    (AiriosDeviceProperty.SOFTWARE_VERSION, "software version"),
+)
+
 
+def _get_bridge_data(data: AiriosDeviceData) -> tuple[int, ProductId, str, int]:
+    values = []
+    for ap, label in _REQUIRED_BRIDGE_PROPERTIES:
+        if (result := data.get(ap)) is None:
+            msg = f"Failed to get bridge {label}"
+            raise ConfigEntryNotReady(msg)
+        values.append(result.value)
+
+    (bridge_rf_address, product_id, product_name, sw_version) = values
     return (bridge_rf_address, product_id, product_name, sw_version)
 
 
+def _set_serial_low_latency(device: str) -> None:
+    """
+    Lower the USB serial adapter latency timer to 1 ms, if supported.
+
+    FTDI adapters buffer received data for 16 ms by default, which adds to every
+    Modbus transaction. Only Linux exposes the timer, and not every adapter or
+    installation allows changing it. Errors are ignored.
+    """
+    tty = Path(device).resolve().name
+    timer = Path("/sys/bus/usb-serial/devices") / tty / "latency_timer"
+    try:
+        if int(timer.read_text()) > 1:
+            timer.write_text("1")
+            _LOGGER.debug("Set latency timer of %s to 1 ms", tty)
+    except FileNotFoundError:
+        _LOGGER.debug("Latency timer of %s not available", tty)
+    except (OSError, ValueError) as err:
+        _LOGGER.debug("Latency timer of %s not changed: %s", tty, err)
+
+
+async def _async_apply_serial_low_latency(
+    hass: HomeAssistant, entry: AiriosConfigEntry
+) -> None:
+    """Lower the serial latency timer if the option is enabled."""
+    if entry.data[CONF_TYPE] == BridgeType.SERIAL and entry.options.get(
+        CONF_SERIAL_LOW_LATENCY, DEFAULT_SERIAL_LOW_LATENCY
+    ):
+        await hass.async_add_executor_job(
+            _set_serial_low_latency, entry.data[CONF_DEVICE]
+        )
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: AiriosConfigEntry) -> bool:
     """Set up Airios from a config entry."""
+    await _async_apply_serial_low_latency(hass, entry)
     transport = _get_transport(entry)
     modbus_address = entry.data[CONF_ADDRESS]
     api = Airios(transport, modbus_address)
@@ -119,6 +154,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: AiriosConfigEntry) -> bo
         fetch_result_status=entry.options.get(
             CONF_FETCH_RESULT_STATUS, DEFAULT_FETCH_RESULT_STATUS
         ),
+        stale_grace=entry.options.get(CONF_STALE_GRACE, DEFAULT_STALE_GRACE),
     )
     await coordinator.async_config_entry_first_refresh()
 
@@ -132,20 +168,35 @@ async def async_setup_entry(hass: HomeAssistant, entry: AiriosConfigEntry) -> bo
         raise ConfigEntryNotReady(message)
 
     entry.async_on_unload(entry.add_update_listener(update_listener))
+    coordinator.bridge_rf_address = rf_address
     entry.runtime_data = coordinator
 
     # Always register a device for the bridge. It is necessary to set the
-    # via_device attribute for the bound nodes.
+    # via_device attribute for the bound nodes. Skip the registry update when
+    # the device is already registered with the same information.
     device_registry = dr.async_get(hass)
-    device_registry.async_get_or_create(
-        config_entry_id=entry.entry_id,
-        identifiers={(DOMAIN, str(rf_address))},
-        manufacturer=DEFAULT_NAME,
-        name=product_name,
-        model=product_name,
-        model_id=f"0x{product_id:08X}",
-        sw_version=f"0x{sw_version:04X}",
-    )
+    identifiers = {(DOMAIN, str(rf_address))}
+    model_id = f"0x{product_id:08X}"
+    sw_version_str = f"0x{sw_version:04X}"
+    device = device_registry.async_get_device(identifiers=identifiers)
+    if (
+        device is None
+        or entry.entry_id not in device.config_entries
+        or device.manufacturer != DEFAULT_NAME
+        or device.name != product_name
+        or device.model != product_name
+        or device.model_id != model_id
+        or device.sw_version != sw_version_str
+    ):
+        device_registry.async_get_or_create(
+            config_entry_id=entry.entry_id,
+            identifiers=identifiers,
+            manufacturer=DEFAULT_NAME,
+            name=product_name,
+            model=product_name,
+            model_id=model_id,
+            sw_version=sw_version_str,
+        )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     # sets up Airios fans, sensors etc.
@@ -153,13 +204,38 @@ async def async_setup_entry(hass: HomeAssistant, entry: AiriosConfigEntry) -> bo
 
 
 async def update_listener(hass: HomeAssistant, entry: AiriosConfigEntry) -> None:
-    """Handle options update."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Handle config entry update."""
+    coordinator: AiriosDataUpdateCoordinator = entry.runtime_data
+    update_interval = dt.timedelta(
+        seconds=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    )
+    fetch_result_status = entry.options.get(
+        CONF_FETCH_RESULT_STATUS, DEFAULT_FETCH_RESULT_STATUS
+    )
+    stale_grace = entry.options.get(CONF_STALE_GRACE, DEFAULT_STALE_GRACE)
+
+    if (
+        update_interval == coordinator.update_interval
+        and fetch_result_status == coordinator.fetch_result_status
+        and stale_grace == coordinator.stale_grace
+    ):
+        # Options are unchanged, so the connection data or the subentries were
+        # updated. Reload to reconnect and to set up the entities of new nodes.
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    # Options only affect polling, apply them without tearing down the entry.
+    await _async_apply_serial_low_latency(hass, entry)
+    coordinator.update_interval = update_interval
+    coordinator.stale_grace = stale_grace
+    if fetch_result_status != coordinator.fetch_result_status:
+        coordinator.fetch_result_status = fetch_result_status
+        await coordinator.async_request_refresh()
 
 
 async def async_unload_entry(hass: HomeAssistant, entry: AiriosConfigEntry) -> bool:
     """Unload a config entry."""
+    coordinator: AiriosDataUpdateCoordinator = entry.runtime_data
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        coordinator: AiriosDataUpdateCoordinator = entry.runtime_data
         coordinator.api.close()
     return unload_ok
@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import logging
-import typing
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -18,15 +18,18 @@ from pyairios.properties import AiriosDeviceProperty, AiriosVMDProperty
 from .entity import (
     AiriosEntity,
     AiriosEntityDescription,
-    find_matching_subentry,
+    entity_key,
+    subentries_by_address,
 )
 
-if typing.TYPE_CHECKING:
+if TYPE_CHECKING:
     from collections.abc import Callable
+    from typing import Any
 
     from homeassistant.config_entries import ConfigEntry, ConfigSubentry
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
     from pyairios.constants import BatteryStatus, FaultStatus
+    from pyairios.properties import AiriosBaseProperty
 
     from .coordinator import AiriosDataUpdateCoordinator
 
@@ -68,33 +71,33 @@ class AiriosBinarySensorEntityDescription(
 BINARY_SENSOR_ENTITIES: tuple[AiriosBinarySensorEntityDescription, ...] = (
     AiriosBinarySensorEntityDescription(
         ap=AiriosDeviceProperty.FAULT_STATUS,
-        key=AiriosDeviceProperty.FAULT_STATUS.name.casefold(),
+        key=entity_key(AiriosDeviceProperty.FAULT_STATUS),
         translation_key="fault_status",
         device_class=BinarySensorDeviceClass.PROBLEM,
         value_fn=_fault_status_value_fn,
     ),
     AiriosBinarySensorEntityDescription(
         ap=AiriosDeviceProperty.RF_COMM_STATUS,
-        key=AiriosDeviceProperty.RF_COMM_STATUS.name.casefold(),
+        key=entity_key(AiriosDeviceProperty.RF_COMM_STATUS),
         translation_key="rf_comm_status",
         device_class=BinarySensorDeviceClass.CONNECTIVITY,
         value_fn=rf_comm_status_value_fn,
     ),
     AiriosBinarySensorEntityDescription(
         ap=AiriosVMDProperty.FILTER_DIRTY,
-        key=AiriosVMDProperty.FILTER_DIRTY.name.casefold(),
+        key=entity_key(AiriosVMDProperty.FILTER_DIRTY),
         translation_key="filter_dirty",
         device_class=BinarySensorDeviceClass.PROBLEM,
     ),
     AiriosBinarySensorEntityDescription(
         ap=AiriosVMDProperty.DEFROST,
-        key=AiriosVMDProperty.DEFROST.name.casefold(),
+        key=entity_key(AiriosVMDProperty.DEFROST),
         translation_key="defrost",
         device_class=BinarySensorDeviceClass.RUNNING,
     ),
     AiriosBinarySensorEntityDescription(
         ap=AiriosDeviceProperty.BATTERY_STATUS,
-        key=AiriosDeviceProperty.BATTERY_STATUS.name.casefold(),
+        key=entity_key(AiriosDeviceProperty.BATTERY_STATUS),
         translation_key="battery_status",
         device_class=BinarySensorDeviceClass.PROBLEM,
         value_fn=_battery_status_value_fn,
@@ -102,12 +105,16 @@ BINARY_SENSOR_ENTITIES: tuple[AiriosBinarySensorEntityDescription, ...] = (
     # VMD07-RP13 specific
     AiriosBinarySensorEntityDescription(
         ap=AiriosVMDProperty.BASIC_VENTILATION_ENABLE,
-        key=AiriosVMDProperty.BASIC_VENTILATION_ENABLE.name.casefold(),
+        key=entity_key(AiriosVMDProperty.BASIC_VENTILATION_ENABLE),
         translation_key="basic_vent_enable",
         device_class=BinarySensorDeviceClass.RUNNING,
     ),
 )
 
+BINARY_SENSOR_ENTITIES_BY_AP: dict[
+    AiriosBaseProperty, AiriosBinarySensorEntityDescription
+] = {description.ap: description for description in BINARY_SENSOR_ENTITIES}
+
 
 class AiriosBinarySensorEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
     AiriosEntity,
@@ -127,30 +134,31 @@ class AiriosBinarySensorEntity(  # pyright: ignore[reportIncompatibleVariableOve
         """Initialize the binary sensor entity."""
         super().__init__(description.key, coordinator, modbus_address, subentry)
         self.entity_description = description  # type: ignore[override]
+        self._value_fn = description.value_fn
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle update data from the coordinator."""
-        try:
-            result = self.fetch_result()
-            if self.entity_description.value_fn:
-                self._attr_is_on = self.entity_description.value_fn(result.value)
-            else:
-                self._attr_is_on = result.value
-            self._attr_available = True
-            if result.status is not None:
-                self.set_extra_state_attributes_internal(result.status)
-        except (TypeError, ValueError) as ex:
+        if (result := self.get_result()) is None:
             _LOGGER.info(
-                "Failed to update binary sensor entity for node=%s, property=%s: %s",
-                f"0x{self.rf_address:06X}",
+                "Failed to update binary sensor entity for node=%s, property=%s: "
+                "result not exists",
+                self._rf_address_hex,
                 self.entity_description.key,
-                ex,
             )
-            self._attr_is_on = None
-            self._attr_available = False
-        finally:
-            self.async_write_ha_state()
+            if self._attr_is_on is None or not self.keep_stale_state():
+                self._attr_is_on = None
+                self._attr_available = False
+        else:
+            value_fn = self._value_fn
+            self._attr_is_on = (
+                value_fn(result.value) if value_fn is not None else result.value
+            )
+            self._attr_available = True
+            self._stale_polls = 0
+            if result.status is not None:
+                self.set_extra_state_attributes_internal(result.status)
+        self.async_write_ha_state_if_changed(self._attr_is_on)
 
 
 async def async_setup_entry(
@@ -160,13 +168,19 @@ async def async_setup_entry(
 ) -> None:
     """Set up the binary sensors."""
     coordinator: AiriosDataUpdateCoordinator = entry.runtime_data
+    subentries = subentries_by_address(entry)
 
+    entities: dict[str | None, list[AiriosBinarySensorEntity]] = defaultdict(list)
     for modbus_address, node in coordinator.data.nodes.items():
-        subentry = find_matching_subentry(entry, modbus_address)
-        entities: list[AiriosBinarySensorEntity] = [
-            AiriosBinarySensorEntity(description, coordinator, modbus_address, subentry)
-            for description in BINARY_SENSOR_ENTITIES
-            if description.ap in node
-        ]
+        if BINARY_SENSOR_ENTITIES_BY_AP.keys().isdisjoint(node):
+            continue
+        subentry = subentries.get(modbus_address)
         subentry_id = subentry.subentry_id if subentry else None
-        async_add_entities(entities, config_subentry_id=subentry_id)
+        entities[subentry_id].extend(
+            AiriosBinarySensorEntity(description, coordinator, modbus_address, subentry)
+            for ap in node
+            if (description := BINARY_SENSOR_ENTITIES_BY_AP.get(ap))
+        )
+
+    for subentry_id, subentry_entities in entities.items():
+        async_add_entities(subentry_entities, config_subentry_id=subentry_id)
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import logging
-import typing
+from collections import defaultdict
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from homeassistant.components.button import (
     ButtonDeviceClass,
@@ -18,16 +19,18 @@ from pyairios.properties import AiriosVMDProperty
 from .entity import (
     AiriosEntity,
     AiriosEntityDescription,
-    find_matching_subentry,
+    entity_key,
+    subentries_by_address,
 )
 
-if typing.TYPE_CHECKING:
+if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
     from homeassistant.config_entries import ConfigEntry, ConfigSubentry
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
     from pyairios.device import AiriosDevice
+    from pyairios.properties import AiriosBaseProperty
 
     from .coordinator import AiriosDataUpdateCoordinator
 
@@ -50,13 +53,17 @@ class AiriosButtonEntityDescription(AiriosEntityDescription, ButtonEntityDescrip
 VMD_BUTTON_ENTITIES: tuple[AiriosButtonEntityDescription, ...] = (
     AiriosButtonEntityDescription(
         ap=AiriosVMDProperty.FILTER_RESET,
-        key=AiriosVMDProperty.FILTER_RESET.name.casefold(),
+        key=entity_key(AiriosVMDProperty.FILTER_RESET),
         translation_key="filter_reset",
         device_class=ButtonDeviceClass.RESTART,
         press_fn=_filter_reset,
     ),
 )
 
+VMD_BUTTON_ENTITIES_BY_AP: dict[AiriosBaseProperty, AiriosButtonEntityDescription] = {
+    description.ap: description for description in VMD_BUTTON_ENTITIES
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,  # noqa: ARG001 # pylint: disable=unused-argument
@@ -65,16 +72,22 @@ async def async_setup_entry(
 ) -> None:
     """Set up the button platform."""
     coordinator: AiriosDataUpdateCoordinator = entry.runtime_data
+    subentries = subentries_by_address(entry)
 
+    entities: dict[str | None, list[AiriosButtonEntity]] = defaultdict(list)
     for modbus_address, node in coordinator.data.nodes.items():
-        subentry = find_matching_subentry(entry, modbus_address)
-        entities: list[AiriosButtonEntity] = [
-            AiriosButtonEntity(description, coordinator, modbus_address, subentry)
-            for description in VMD_BUTTON_ENTITIES
-            if description.ap in node
-        ]
+        if VMD_BUTTON_ENTITIES_BY_AP.keys().isdisjoint(node):
+            continue
+        subentry = subentries.get(modbus_address)
         subentry_id = subentry.subentry_id if subentry else None
-        async_add_entities(entities, config_subentry_id=subentry_id)
+        entities[subentry_id].extend(
+            AiriosButtonEntity(description, coordinator, modbus_address, subentry)
+            for ap in node
+            if (description := VMD_BUTTON_ENTITIES_BY_AP.get(ap))
+        )
+
+    for subentry_id, subentry_entities in entities.items():
+        async_add_entities(subentry_entities, config_subentry_id=subentry_id)
 
 
 class AiriosButtonEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
@@ -95,12 +108,14 @@ class AiriosButtonEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
         """Initialize the Airios button entity."""
         super().__init__(description.key, coordinator, modbus_address, subentry)
         self.entity_description = description  # type: ignore[override]
+        self._press_fn = description.press_fn
 
     async def async_press(self) -> None:
         """Handle button press."""
         _LOGGER.debug("Button %s pressed", self.entity_description.key)
         try:
-            dev = await self.api().node(self.modbus_address)
-            await self.entity_description.press_fn(dev)
+            dev = await self.device()
+            await self._press_fn(dev)
         except AiriosException as ex:
+            self.invalidate_device()
             raise HomeAssistantError from ex
@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import typing
-from typing import Any, Self
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, ClassVar, Self
 
 import serial
 import serial.tools.list_ports
@@ -47,21 +47,63 @@ from .const import (
     CONF_DEFAULT_SERIAL_MODBUS_ADDRESS,
     CONF_FETCH_RESULT_STATUS,
     CONF_RF_ADDRESS,
+    CONF_SERIAL_LOW_LATENCY,
+    CONF_STALE_GRACE,
     DEFAULT_FETCH_RESULT_STATUS,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_SERIAL_LOW_LATENCY,
+    DEFAULT_STALE_GRACE,
     DOMAIN,
     BridgeType,
 )
 
-if typing.TYPE_CHECKING:
+if TYPE_CHECKING:
     from types import MappingProxyType
 
+    from pyairios.client import AiriosBaseTransport
+    from pyairios.device import AiriosBoundDeviceInfo
+    from serial.tools.list_ports_common import ListPortInfo
+
     from .coordinator import AiriosDataUpdateCoordinator
 
 CONF_MANUAL_PATH = "Enter Manually"
+CONF_RESCAN_PORTS = "Rescan ports"
+
+_SERIAL_MANUAL_PATH_SCHEMA = vol.Schema({vol.Required(CONF_DEVICE): str})
+
+# Ethernet bridge closes connection when no communication for 3 mins
+_OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_SCAN_INTERVAL, default=DEFAULT_SCAN_INTERVAL): vol.All(
+            vol.Coerce(int), vol.Range(min=15, max=150)
+        ),
+        vol.Required(
+            CONF_FETCH_RESULT_STATUS, default=DEFAULT_FETCH_RESULT_STATUS
+        ): bool,
+        vol.Required(CONF_STALE_GRACE, default=DEFAULT_STALE_GRACE): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=10)
+        ),
+        vol.Required(CONF_SERIAL_LOW_LATENCY, default=DEFAULT_SERIAL_LOW_LATENCY): bool,
+    }
+)
 
 _LOGGER = logging.getLogger(__name__)
 
+# Supported models by device type and supported product IDs by value, filled on
+# first use. The models are static.
+_SUPPORTED_MODELS: dict[AiriosDeviceType, dict[ProductId, str]] = {}
+_SUPPORTED_PRODUCT_IDS: dict[int, ProductId] = {}
+
+
+async def _load_supported_models() -> None:
+    if _SUPPORTED_MODELS:
+        return
+    models: dict[AiriosDeviceType, dict[ProductId, str]] = {}
+    for item in await factory.model_descriptions():
+        models.setdefault(item.type, {})[item.product_id] = ", ".join(item.description)
+        _SUPPORTED_PRODUCT_IDS[item.product_id] = item.product_id
+    _SUPPORTED_MODELS.update(models)
+
 
 async def _supported_models(
     device_type: AiriosDeviceType,
@@ -73,13 +115,76 @@ async def _supported_models(
     :param prefix: filter for device types (use model property?)
     :return: dict of supported models matching prefix
     """
+    await _load_supported_models()
+    return _SUPPORTED_MODELS.get(device_type, {})
+
+
+async def _supported_product_id(value: int) -> ProductId | None:
+    """Return the supported product ID for a form value, or None if unknown."""
+    await _load_supported_models()
+    return _SUPPORTED_PRODUCT_IDS.get(value)
+
+
+def _serial_port_name(port: ListPortInfo) -> str:
+    """Return a readable name for a serial port."""
+    vid = f"{port.vid:04X}" if port.vid else None
+    pid = f"{port.pid:04X}" if port.pid else None
+    return usb.human_readable_device_name(
+        port.device,
+        port.serial_number,
+        port.manufacturer,
+        port.description,
+        vid,
+        pid,
+    )
+
+
+def _list_serial_ports() -> dict[str, str]:
+    """List serial ports with readable names. Blocking, run in the executor."""
     return {
-        item.product_id: ", ".join(item.description)
-        for item in await factory.model_descriptions()
-        if item.type == device_type
+        port.device: _serial_port_name(port)
+        for port in serial.tools.list_ports.comports()
     }
 
 
+def _first_free_modbus_address(nodes: list[AiriosBoundDeviceInfo]) -> int:
+    """Return the first Modbus address not assigned to any bound node."""
+    used = {n.modbus_address for n in nodes}
+    for modbus_address in range(2, 200):
+        if modbus_address not in used:
+            return modbus_address
+    msg = "No free Modbus address available"
+    raise AiriosBindingException(msg)
+
+
+async def _wait_binding_status(
+    api: Airios, pending: BindingStatus, max_wait: float
+) -> BindingStatus:
+    """
+    Poll the binding status until it leaves the pending state or times out.
+
+    The poll interval starts short to catch quick transitions and backs off to
+    one second to limit bridge traffic during long binding windows.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_wait
+    delay = 0.1
+    status = BindingStatus.NOT_AVAILABLE
+    while loop.time() < deadline:
+        await asyncio.sleep(delay)
+        delay = min(delay * 1.5, 1.0)
+        result = await api.bind_status()
+        if result and result.value:
+            status = result.value
+        else:
+            msg = "Failed to get binding status"
+            raise AiriosBindingException(msg)
+        _LOGGER.debug("Binding status: %s", str(status))
+        if status != pending:
+            break
+    return status
+
+
 class AiriosConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Airios."""
 
@@ -87,6 +192,14 @@ class AiriosConfigFlow(ConfigFlow, domain=DOMAIN):
 
     _reconfigure_data: MappingProxyType[str, Any]
     _modbus_address: int
+    _serial_ports: dict[str, str] | None = None
+    _probe_clients: dict[tuple[Any, ...], tuple[int, Airios]]
+
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        # Clients used to validate bridges, keyed by transport and reused when
+        # the user retries the same connection settings.
+        self._probe_clients = {}
 
     def is_matching(  # pyright: ignore[reportIncompatibleMethodOverride]
         self,
@@ -105,7 +218,38 @@ class AiriosConfigFlow(ConfigFlow, domain=DOMAIN):
             menu_options=["serial", "network"],
         )
 
+    @callback
+    def async_remove(self) -> None:
+        """Close the validation clients when the flow is removed."""
+        self._close_probe_clients()
+
+    def _probe_client(
+        self,
+        key: tuple[Any, ...],
+        transport: AiriosBaseTransport,
+        modbus_address: int,
+    ) -> Airios:
+        if (cached := self._probe_clients.get(key)) is not None:
+            if cached[0] == modbus_address:
+                return cached[1]
+            # Only one client can own the port, drop the one for the old address
+            self._close_probe_client(key)
+        api = Airios(transport, modbus_address)
+        self._probe_clients[key] = (modbus_address, api)
+        return api
+
+    def _close_probe_client(self, key: tuple[Any, ...]) -> None:
+        if (cached := self._probe_clients.pop(key, None)) is not None:
+            cached[1].close()
+
+    def _close_probe_clients(self) -> None:
+        for _, api in self._probe_clients.values():
+            api.close()
+        self._probe_clients.clear()
+
     async def _finish(self, entry_data: dict[str, Any]) -> ConfigFlowResult:
+        # Release the bridge connection before the config entry opens its own
+        self._close_probe_clients()
         bridge_rf_address = entry_data[CONF_BRIDGE_RF_ADDRESS]
         if self.source == SOURCE_USER:
             return self.async_create_entry(
@@ -145,12 +289,10 @@ class AiriosConfigFlow(ConfigFlow, domain=DOMAIN):
         conf_port = CONF_DEFAULT_PORT
         conf_modbus_address = CONF_DEFAULT_NETWORK_MODBUS_ADDRESS
         if self.source == SOURCE_RECONFIGURE:
-            if hasattr(self._reconfigure_data, CONF_HOST):
-                conf_host = self._reconfigure_data[CONF_HOST]
-            if hasattr(self._reconfigure_data, CONF_PORT):
-                conf_port = self._reconfigure_data[CONF_PORT]
-            if hasattr(self._reconfigure_data, CONF_ADDRESS):
-                conf_modbus_address = self._reconfigure_data[CONF_ADDRESS]
+            current = self._reconfigure_data
+            conf_host = current.get(CONF_HOST, conf_host)
+            conf_port = current.get(CONF_PORT, conf_port)
+            conf_modbus_address = current.get(CONF_ADDRESS, conf_modbus_address)
         schema = vol.Schema(
             {
                 vol.Required(CONF_HOST, default=conf_host): str,
@@ -170,7 +312,9 @@ class AiriosConfigFlow(ConfigFlow, domain=DOMAIN):
         """Step when setting up serial configuration."""
         errors: dict[str, str] = {}
 
-        if user_input is not None:
+        if user_input is not None and user_input[CONF_DEVICE] == CONF_RESCAN_PORTS:
+            self._serial_ports = None
+        elif user_input is not None:
             modbus_address = user_input[CONF_ADDRESS]
             user_selection = user_input[CONF_DEVICE]
             if user_selection == CONF_MANUAL_PATH:
@@ -191,27 +335,24 @@ class AiriosConfigFlow(ConfigFlow, domain=DOMAIN):
             else:
                 return await self._finish(data)
 
-        ports = await self.hass.async_add_executor_job(serial.tools.list_ports.comports)
-        list_of_ports = {
-            port.device: usb.human_readable_device_name(
-                port.device,
-                port.serial_number,
-                port.manufacturer,
-                port.description,
-                f"{port.vid}" if port.vid else None,
-                f"{port.pid}" if port.pid else None,
+        # Scanning ports can be slow, only do it once per flow unless the user
+        # asks for a rescan.
+        if self._serial_ports is None:
+            self._serial_ports = await self.hass.async_add_executor_job(
+                _list_serial_ports
             )
-            for port in ports
-        }
 
-        list_of_ports[CONF_MANUAL_PATH] = CONF_MANUAL_PATH
+        list_of_ports = {
+            **self._serial_ports,
+            CONF_RESCAN_PORTS: CONF_RESCAN_PORTS,
+            CONF_MANUAL_PATH: CONF_MANUAL_PATH,
+        }
         conf_device = vol.UNDEFINED
         conf_modbus_address = CONF_DEFAULT_SERIAL_MODBUS_ADDRESS
         if self.source == SOURCE_RECONFIGURE:
-            if hasattr(self._reconfigure_data, CONF_DEVICE):
-                conf_device = self._reconfigure_data[CONF_DEVICE]
-            if hasattr(self._reconfigure_data, CONF_ADDRESS):
-                conf_modbus_address = self._reconfigure_data[CONF_ADDRESS]
+            current = self._reconfigure_data
+            conf_device = current.get(CONF_DEVICE, conf_device)
+            conf_modbus_address = current.get(CONF_ADDRESS, conf_modbus_address)
 
         schema = vol.Schema(
             {
@@ -245,13 +386,9 @@ class AiriosConfigFlow(ConfigFlow, domain=DOMAIN):
             else:
                 return await self._finish(data)
 
-        conf_device = vol.UNDEFINED
-        if self.source == SOURCE_RECONFIGURE and hasattr(
-            self._reconfigure_data, CONF_DEVICE
-        ):
-            conf_device = self._reconfigure_data[CONF_DEVICE]
-
-        schema = vol.Schema({vol.Required(CONF_DEVICE, default=conf_device): str})
+        schema = _SERIAL_MANUAL_PATH_SCHEMA
+        if self.source == SOURCE_RECONFIGURE:
+            schema = self.add_suggested_values_to_schema(schema, self._reconfigure_data)
         return self.async_show_form(
             step_id="serial_manual_path",
             data_schema=schema,
@@ -281,9 +418,14 @@ class AiriosConfigFlow(ConfigFlow, domain=DOMAIN):
         device: str,
         modbus_address: int,
     ) -> dict[str, Any]:
+        key = (device,)
         transport = AiriosRtuTransport(device=device)
-        api = Airios(transport, modbus_address)
-        bridge_rf_address = await self._async_validate_bridge(api)
+        api = self._probe_client(key, transport, modbus_address)
+        try:
+            bridge_rf_address = await self._async_validate_bridge(api)
+        except AiriosException:
+            self._close_probe_client(key)
+            raise
         data: dict[str, Any] = {
             CONF_TYPE: BridgeType.SERIAL,
             CONF_DEVICE: device,
@@ -298,9 +440,14 @@ class AiriosConfigFlow(ConfigFlow, domain=DOMAIN):
         port: int,
         modbus_address: int,
     ) -> dict[str, Any]:
+        key = (host, port)
         transport = AiriosTcpTransport(host=host, port=port)
-        api = Airios(transport, modbus_address)
-        bridge_rf_address = await self._async_validate_bridge(api)
+        api = self._probe_client(key, transport, modbus_address)
+        try:
+            bridge_rf_address = await self._async_validate_bridge(api)
+        except AiriosException:
+            self._close_probe_client(key)
+            raise
         data: dict[str, Any] = {
             CONF_TYPE: BridgeType.NETWORK,
             CONF_HOST: host,
@@ -347,109 +494,50 @@ class OptionsFlowHandler(OptionsFlow):
         if user_input is not None:
             return self.async_create_entry(data=user_input)
 
-        scan_interval = self.config_entry.options.get(
-            CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
-        )
-        fetch_result = self.config_entry.options.get(
-            CONF_FETCH_RESULT_STATUS, DEFAULT_FETCH_RESULT_STATUS
+        return self.async_show_form(
+            step_id="init",
+            data_schema=self.add_suggested_values_to_schema(
+                _OPTIONS_SCHEMA, self.config_entry.options
+            ),
         )
 
-        # Ethernet bridge closes connection when no communication for 3 mins
-        opts_schema = vol.Schema(
-            {
-                vol.Required(CONF_SCAN_INTERVAL, default=scan_interval): vol.All(
-                    vol.Coerce(int), vol.Range(min=15, max=150)
-                ),
-                vol.Required(CONF_FETCH_RESULT_STATUS, default=fetch_result): bool,
-            }
-        )
-        return self.async_show_form(step_id="init", data_schema=opts_schema)
 
+class _BindSubentryFlowHandler(ConfigSubentryFlow, ABC):
+    """Binding steps shared by the controller and accessory subentry flows."""
 
-class ControllerSubentryFlowHandler(ConfigSubentryFlow):
-    """Handle subentry flow."""
+    _BIND_PENDING: ClassVar[BindingStatus]
+    _BIND_COMPLETED: ClassVar[BindingStatus]
+    # Seconds to wait for the bridge to leave the pending binding status
+    _BIND_MAX_WAIT: ClassVar[float]
 
     _bind_task: asyncio.Task | None = None
     _bind_result: BindingStatus | None = None
     _bind_product_id: ProductId
-    _bind_product_serial: int | None
     _modbus_address: int | None
     _name: str | None
 
-    async def async_step_user(
-        self, user_input: dict[str, Any] | None = None
-    ) -> SubentryFlowResult:
-        """Bind a new controller."""
-        errors: dict[str, str] = {}
-        if user_input is not None:
-            self._bind_product_serial = user_input.get(CONF_RF_ADDRESS)
-            self._name = user_input.get(CONF_NAME)
-            try:
-                product = user_input[CONF_DEVICE]
-                product_id = ProductId(product)
-                if product_id is None:
-                    errors["base"] = "unexpected_product_id"
-                else:
-                    self._bind_product_id = product_id
-            except ValueError:
-                errors["base"] = "unexpected_product_id"
-            return await self.async_step_do_bind_controller()
-
-        # Fetch supported models from library
-        ctrls = await _supported_models(AiriosDeviceType.CONTROLLER)
-        bind_schema = vol.Schema(
-            {
-                vol.Required(CONF_NAME): str,
-                vol.Required(CONF_DEVICE): vol.In(ctrls),
-                vol.Optional(CONF_RF_ADDRESS): int,
-            }
-        )
-        return self.async_show_form(
-            step_id="user", data_schema=bind_schema, errors=errors
-        )
+    @abstractmethod
+    async def _send_bind(self, api: Airios, modbus_address: int) -> bool:
+        """Send the bind command for a new node at the given Modbus address."""
 
     async def _do_bind(self) -> None:
         if self._bind_product_id is None:
             msg = "Unexpected error, product ID not defined"
             raise AiriosBindingException(msg)
-        _LOGGER.info(
-            "Binding new controller (product_id=%s, product_serial=%s)",
-            self._bind_product_id,
-            self._bind_product_serial,
-        )
         config_entry = self._get_entry()
         coordinator: AiriosDataUpdateCoordinator = config_entry.runtime_data
         api = coordinator.api
 
         _LOGGER.debug("Searching first unassigned Modbus address")
-        nodes = await api.nodes()
-        addrs = list(range(2, 200))
-        for n in nodes:
-            addrs.remove(n.modbus_address)
-        modbus_address = addrs[0]
+        modbus_address = _first_free_modbus_address(await api.nodes())
 
-        _LOGGER.info(
-            "Initiating controller binding (Modbus address: %s)", modbus_address
-        )
-        if not await api.bind_controller(
-            modbus_address, self._bind_product_id, self._bind_product_serial
-        ):
+        if not await self._send_bind(api, modbus_address):
             msg = "Failed to send bind command"
             raise AiriosBindingException(msg)
-        status = BindingStatus.NOT_AVAILABLE
-        # Bridge timeout is 20 seconds
-        for _ in range(1, 100):
-            await asyncio.sleep(0.250)
-            result = await api.bind_status()
-            if result and result.value:
-                status = result.value
-            else:
-                msg = "Failed to get binding status"
-                raise AiriosBindingException(msg)
-            _LOGGER.debug("Binding status: %s", str(status))
-            if status != BindingStatus.OUTGOING_BINDING_INITIALIZED:
-                break
-        if status != BindingStatus.OUTGOING_BINDING_COMPLETED:
+        status = await _wait_binding_status(
+            api, self._BIND_PENDING, self._BIND_MAX_WAIT
+        )
+        if status != self._BIND_COMPLETED:
             # Unbind to remove the virtual Modbus device from the bridge
             await api.unbind(modbus_address)
             self._bind_result = status
@@ -458,20 +546,19 @@ class ControllerSubentryFlowHandler(ConfigSubentryFlow):
         self._modbus_address = modbus_address
         self._bind_result = status
 
-    async def async_step_do_bind_controller(
-        self,
-        user_input: dict[str, Any] | None = None,  # noqa: ARG002 # pylint: disable=unused-argument
+    async def _async_step_do_bind(
+        self, step_id: str, progress_action: str
     ) -> SubentryFlowResult:
-        """Perform the controller binding while showing a progress form."""
+        """Perform the binding while showing a progress form."""
         if self._bind_task is None:
             self._bind_task = self.hass.async_create_task(
-                self._do_bind(), eager_start=False
+                self._do_bind(), eager_start=True
             )
 
         if not self._bind_task.done():
             return self.async_show_progress(
-                step_id="do_bind_controller",
-                progress_action="bind_controller",
+                step_id=step_id,
+                progress_action=progress_action,
                 progress_task=self._bind_task,
             )
 
@@ -504,7 +591,7 @@ class ControllerSubentryFlowHandler(ConfigSubentryFlow):
         if self._bind_result is None:
             msg = "Unexpected error, bind result not defined"
             raise AiriosBindingException(msg)
-        if self._bind_result != BindingStatus.OUTGOING_BINDING_COMPLETED:
+        if self._bind_result != self._BIND_COMPLETED:
             msg = f"Unexpected bind result {self._bind_result}"
             raise AiriosBindingException(msg)
         if self._modbus_address is None:
@@ -532,25 +619,82 @@ class ControllerSubentryFlowHandler(ConfigSubentryFlow):
         )
 
 
-class AccessorySubentryFlowHandler(ConfigSubentryFlow):
+class ControllerSubentryFlowHandler(_BindSubentryFlowHandler):
     """Handle subentry flow."""
 
-    _bind_task: asyncio.Task | None = None
-    _bind_result: BindingStatus | None = None
+    _BIND_PENDING = BindingStatus.OUTGOING_BINDING_INITIALIZED
+    _BIND_COMPLETED = BindingStatus.OUTGOING_BINDING_COMPLETED
+    # Bridge timeout is 20 seconds
+    _BIND_MAX_WAIT = 25
+
+    _bind_product_serial: int | None
+
+    async def async_step_user(
+        self, user_input: dict[str, Any] | None = None
+    ) -> SubentryFlowResult:
+        """Bind a new controller."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            self._bind_product_serial = user_input.get(CONF_RF_ADDRESS)
+            self._name = user_input.get(CONF_NAME)
+            product_id = await _supported_product_id(user_input[CONF_DEVICE])
+            if product_id is not None:
+                self._bind_product_id = product_id
+                return await self.async_step_do_bind_controller()
+            errors["base"] = "unexpected_product_id"
+
+        # Fetch supported models from library
+        ctrls = await _supported_models(AiriosDeviceType.CONTROLLER)
+        bind_schema = vol.Schema(
+            {
+                vol.Required(CONF_NAME): str,
+                vol.Required(CONF_DEVICE): vol.In(ctrls),
+                vol.Optional(CONF_RF_ADDRESS): int,
+            }
+        )
+        return self.async_show_form(
+            step_id="user", data_schema=bind_schema, errors=errors
+        )
+
+    async def _send_bind(self, api: Airios, modbus_address: int) -> bool:
+        """Send the bind command for a new controller."""
+        _LOGGER.info(
+            "Initiating controller binding "
+            "(Modbus address: %s, product_id=%s, product_serial=%s)",
+            modbus_address,
+            self._bind_product_id,
+            self._bind_product_serial,
+        )
+        return await api.bind_controller(
+            modbus_address, self._bind_product_id, self._bind_product_serial
+        )
+
+    async def async_step_do_bind_controller(
+        self,
+        user_input: dict[str, Any] | None = None,  # noqa: ARG002 # pylint: disable=unused-argument
+    ) -> SubentryFlowResult:
+        """Perform the controller binding while showing a progress form."""
+        return await self._async_step_do_bind("do_bind_controller", "bind_controller")
+
+
+class AccessorySubentryFlowHandler(_BindSubentryFlowHandler):
+    """Handle subentry flow."""
+
+    _BIND_PENDING = BindingStatus.INCOMING_BINDING_ACTIVE
+    _BIND_COMPLETED = BindingStatus.INCOMING_BINDING_COMPLETED
+    # Bridge timeout is 120 seconds
+    _BIND_MAX_WAIT = 125
+
     _bind_controller_modbus_address: int
-    _bind_product_id: ProductId
-    _modbus_address: int | None
-    _name: str | None
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> SubentryFlowResult:
         """Bind a new remote or sensor."""
 
-        async def _show_form(
+        def _show_form(
             bound_controllers: dict[Any, Any], errors: dict[str, str]
         ) -> SubentryFlowResult:
-            accs = await _supported_models(AiriosDeviceType.ACCESSORY)
             bind_schema = vol.Schema(
                 {
                     vol.Required(CONF_NAME): str,
@@ -574,163 +718,64 @@ class AccessorySubentryFlowHandler(ConfigSubentryFlow):
         # when configuring the integration and devices are already bound to the RF
         # bridge.
         coordinator: AiriosDataUpdateCoordinator = config_entry.runtime_data
-        api_bound_nodes = {
-            dev.modbus_address: ", ".join(dev.description)
-            for dev in await coordinator.api.nodes()
-            if dev.type == AiriosDeviceType.CONTROLLER
-            and dev.modbus_address not in bound_controllers
-        }
-
-        # Get the name from device registry for user convenience.
+        nodes, accs = await asyncio.gather(
+            coordinator.api.nodes(),
+            _supported_models(AiriosDeviceType.ACCESSORY),
+        )
+        # Get the name from device registry for user convenience. Devices are
+        # identified by their RF address.
         registry = dr.async_get(self.hass)
-        for key in api_bound_nodes:
-            if regdev := registry.async_get_device(identifiers={(DOMAIN, str(key))}):
-                if regdev.name_by_user:
-                    api_bound_nodes[key] = regdev.name_by_user
-                elif regdev.name:
-                    api_bound_nodes[key] = regdev.name
-
-        bound_controllers.update(api_bound_nodes)
+        registry_names = {
+            identifier: name
+            for regdev in dr.async_entries_for_config_entry(
+                registry, config_entry.entry_id
+            )
+            if (name := regdev.name_by_user or regdev.name)
+            for domain, identifier in regdev.identifiers
+            if domain == DOMAIN
+        }
+        bound_controllers.update(
+            {
+                dev.modbus_address: registry_names.get(str(dev.rf_address))
+                or ", ".join(dev.description)
+                for dev in nodes
+                if dev.type == AiriosDeviceType.CONTROLLER
+                and dev.modbus_address not in bound_controllers
+            }
+        )
 
         if user_input is not None:
             self._name = user_input[CONF_NAME]
             self._bind_controller_modbus_address = user_input[CONF_ADDRESS]
-            try:
-                product = user_input[CONF_DEVICE]
-                product_id = ProductId(product)
-                if product_id is None:
-                    errors["base"] = "unexpected_product_id"
-                    return await _show_form(bound_controllers, errors)
-                self._bind_product_id = product_id
-            except ValueError:
+            product_id = await _supported_product_id(user_input[CONF_DEVICE])
+            if product_id is None:
                 errors["base"] = "unexpected_product_id"
-                return await _show_form(bound_controllers, errors)
+                return _show_form(bound_controllers, errors)
+            self._bind_product_id = product_id
             return await self.async_step_do_bind_accessory()
-        return await _show_form(bound_controllers, errors)
+        return _show_form(bound_controllers, errors)
 
-    async def _do_bind(self) -> None:
-        if self._bind_product_id is None:
-            msg = "Unexpected error, product ID not defined"
-            raise AiriosBindingException(msg)
+    async def _send_bind(self, api: Airios, modbus_address: int) -> bool:
+        """Send the bind command for a new accessory."""
         _LOGGER.info(
-            "Binding new accessory (controller Modbus address: %s, product ID: %s)",
+            "Initiating accessory binding "
+            "(Modbus address: %s, controller Modbus address: %s, product ID: %s)",
+            modbus_address,
             self._bind_controller_modbus_address,
             self._bind_product_id,
         )
-        config_entry = self._get_entry()
-        coordinator: AiriosDataUpdateCoordinator = config_entry.runtime_data
-        api = coordinator.api
-
-        _LOGGER.debug("Searching first unassigned Modbus address")
-        nodes = await api.nodes()
-        addrs = list(range(2, 200))
-        for n in nodes:
-            addrs.remove(n.modbus_address)
-        modbus_address = addrs[0]
-
-        _LOGGER.info(
-            "Initiating accessory binding (Modbus address: %s)", modbus_address
-        )
-        if not await api.bind_accessory(
+        return await api.bind_accessory(
             self._bind_controller_modbus_address,
             modbus_address,
             self._bind_product_id,
-        ):
-            msg = "Failed to send bind command"
-            raise AiriosBindingException(msg)
-        status = BindingStatus.NOT_AVAILABLE
-        # Bridge timeout is 120 seconds
-        for _ in range(1, 500):
-            await asyncio.sleep(0.250)
-            result = await api.bind_status()
-            if result and result.value:
-                status = result.value
-            else:
-                msg = "Failed to get binding status"
-                raise AiriosBindingException(msg)
-            _LOGGER.debug("Binding status: %s", str(status))
-            if status != BindingStatus.INCOMING_BINDING_ACTIVE:
-                break
-        if status != BindingStatus.INCOMING_BINDING_COMPLETED:
-            # Unbind to remove the virtual Modbus device from the bridge
-            await api.unbind(modbus_address)
-            self._bind_result = status
-            msg = f"Bind failed: {status}"
-            raise AiriosBindingException(msg)
-        self._modbus_address = modbus_address
-        self._bind_result = status
+        )
 
     async def async_step_do_bind_accessory(
         self,
         user_input: dict[str, Any] | None = None,  # noqa: ARG002 # pylint: disable=unused-argument
     ) -> SubentryFlowResult:
         """Perform the accessory binding while showing a progress form."""
-        if self._bind_task is None:
-            self._bind_task = self.hass.async_create_task(
-                self._do_bind(), eager_start=False
-            )
-
-        if not self._bind_task.done():
-            return self.async_show_progress(
-                step_id="do_bind_accessory",
-                progress_action="bind_accessory",
-                progress_task=self._bind_task,
-            )
-        try:
-            await self._bind_task
-        except AiriosException:
-            _LOGGER.exception("Bind failed")
-            return self.async_show_progress_done(next_step_id="bind_failed")
-        finally:
-            self._bind_task = None
-
-        return self.async_show_progress_done(next_step_id="bind_done")
-
-    async def async_step_bind_failed(
-        self,
-        user_input: dict[str, Any] | None = None,  # noqa: ARG002 # pylint: disable=unused-argument
-    ) -> SubentryFlowResult:
-        """Bind failed."""
-        if self._bind_result is not None:
-            reason = str(self._bind_result)
-        else:
-            reason = "bind_failed"
-        return self.async_abort(reason=reason)
-
-    async def async_step_bind_done(
-        self,
-        user_input: dict[str, Any] | None = None,  # noqa: ARG002 # pylint: disable=unused-argument
-    ) -> SubentryFlowResult:
-        """Show the result of the bind step."""
-        if self._bind_result is None:
-            msg = "Unexpected error, bind result not defined"
-            raise AiriosBindingException(msg)
-        if self._bind_result != BindingStatus.INCOMING_BINDING_COMPLETED:
-            msg = f"Unexpected bind result {self._bind_result}"
-            raise AiriosBindingException(msg)
-        if self._modbus_address is None:
-            msg = "Unexpected error, Modbus address not defined"
-            raise AiriosBindingException(msg)
-
-        config_entry = self._get_entry()
-        coordinator: AiriosDataUpdateCoordinator = config_entry.runtime_data
-        api = coordinator.api
-        node = await api.node(self._modbus_address)
-        result = await node.device_rf_address()
-        if result is None or result.value is None:
-            msg = "Unexpected error reading node RF address"
-            raise AiriosBindingException(msg)
-        rf_address = result.value
-
-        return self.async_create_entry(
-            data={
-                CONF_NAME: self._name,
-                CONF_ADDRESS: self._modbus_address,
-                CONF_DEVICE: self._bind_product_id,
-                CONF_RF_ADDRESS: rf_address,
-            },
-            title=self._name,
-        )
+        return await self._async_step_do_bind("do_bind_accessory", "bind_accessory")
 
 
 class UnexpectedProductIdError(HomeAssistantError):
@@ -1,21 +1,25 @@
 """Constants for the Airios integration."""
 
-from enum import IntEnum, auto
+from enum import IntEnum
 
 
 class BridgeType(IntEnum):
-    """Type of RF bridge."""
+    """Type of RF bridge. The values are stored in config entries."""
 
-    SERIAL = auto()
-    NETWORK = auto()
+    SERIAL = 1
+    NETWORK = 2
 
 
 DOMAIN = "airios_ventilation"
 DEFAULT_NAME = "Airios"
 DEFAULT_SCAN_INTERVAL = 30
 DEFAULT_FETCH_RESULT_STATUS = False
+DEFAULT_STALE_GRACE = 0
+DEFAULT_SERIAL_LOW_LATENCY = False
 
 CONF_FETCH_RESULT_STATUS = "fetch_result_status"
+CONF_STALE_GRACE = "stale_grace"
+CONF_SERIAL_LOW_LATENCY = "serial_low_latency"
 CONF_BRIDGE_RF_ADDRESS = "bridge_rf_address"
 CONF_RF_ADDRESS = "rf_address"
 CONF_DEFAULT_TYPE = BridgeType.SERIAL
@@ -2,9 +2,10 @@
 
 from __future__ import annotations
 
-import datetime
+import datetime as dt
 import logging
-import typing
+from functools import partial
+from typing import TYPE_CHECKING
 
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from pyairios.data_model import AiriosData
@@ -12,8 +13,11 @@ from pyairios.exceptions import AiriosException
 
 from .const import DEFAULT_NAME
 
-if typing.TYPE_CHECKING:
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.device_registry import DeviceInfo
     from pyairios import Airios
 
 _LOGGER = logging.getLogger(__name__)
@@ -22,7 +26,12 @@ _LOGGER = logging.getLogger(__name__)
 class AiriosDataUpdateCoordinator(DataUpdateCoordinator[AiriosData]):
     """The Airios data update coordinator."""
 
-    fetch_result_status: bool
+    _fetch_result_status: bool
+    _fetch: Callable[[], Awaitable[AiriosData]]
+    stale_grace: int
+    bridge_rf_address: int | None
+    # RF address, RF address string and device info, by node Modbus address
+    node_info: dict[int, tuple[int, str, DeviceInfo]]
 
     def __init__(
         self,
@@ -31,22 +40,37 @@ class AiriosDataUpdateCoordinator(DataUpdateCoordinator[AiriosData]):
         update_interval: int,
         *,
         fetch_result_status: bool,
+        stale_grace: int,
     ) -> None:
         """Initialize the Airios data coordinator."""
         super().__init__(
             hass,
             _LOGGER,
             name=f"{DEFAULT_NAME} DataUpdateCoordinator",
-            update_interval=datetime.timedelta(seconds=update_interval),
+            update_interval=dt.timedelta(seconds=update_interval),
         )
         self.api = api
         self.fetch_result_status = fetch_result_status
+        self.stale_grace = stale_grace
+        self.bridge_rf_address = None
+        self.node_info = {}
+
+    @property
+    def fetch_result_status(self) -> bool:
+        """Return True if the result metadata is fetched with the values."""
+        return self._fetch_result_status
+
+    @fetch_result_status.setter
+    def fetch_result_status(self, value: bool) -> None:
+        """Set whether the result metadata is fetched with the values."""
+        self._fetch_result_status = value
+        self._fetch = partial(self.api.fetch, with_status=value)
 
     async def _async_update_data(self) -> AiriosData:
         """Fetch state by polling API and forward it to Home Assistant."""
         _LOGGER.debug("Updating HA data state cache")
         try:
-            return await self.api.fetch(with_status=self.fetch_result_status)
+            return await self._fetch()
         except AiriosException as err:
             msg = "Error during state cache update"
             raise UpdateFailed(msg) from err
@@ -3,10 +3,12 @@
 from __future__ import annotations
 
 import logging
-import typing
 from dataclasses import dataclass
+from functools import cache
+from typing import TYPE_CHECKING, Any, cast
 
 from homeassistant.const import CONF_ADDRESS
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryNotReady, PlatformNotReady
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -15,15 +17,25 @@ from pyairios.properties import AiriosBaseProperty, AiriosDeviceProperty
 from .const import DEFAULT_NAME, DOMAIN
 from .coordinator import AiriosDataUpdateCoordinator
 
-if typing.TYPE_CHECKING:
+if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry, ConfigSubentry
     from pyairios import Airios
+    from pyairios.data_model import AiriosDeviceData
+    from pyairios.device import AiriosDevice
     from pyairios.registers import Result, ResultStatus
 
 
 _LOGGER = logging.getLogger(__name__)
 
 
+_REQUIRED_NODE_PROPERTIES: tuple[tuple[AiriosDeviceProperty, str], ...] = (
+    (AiriosDeviceProperty.RF_ADDRESS, "RF address"),
+    (AiriosDeviceProperty.PRODUCT_NAME, "product name"),
+    (AiriosDeviceProperty.PRODUCT_ID, "product ID"),
+    (AiriosDeviceProperty.SOFTWARE_VERSION, "software version"),
+)
+
+
 @dataclass(frozen=True, kw_only=True)
 class AiriosEntityDescription:
     """Base class for Airios entities descriptions."""
@@ -31,14 +43,65 @@ class AiriosEntityDescription:
     ap: AiriosBaseProperty
 
 
-def find_matching_subentry(
-    entry: ConfigEntry, modbus_address: int
-) -> ConfigSubentry | None:
-    """Find matching subentry for entities."""
-    for se in entry.subentries.values():
-        if se.data[CONF_ADDRESS] == modbus_address:
-            return se
-    return None
+@cache
+def entity_key(ap: AiriosBaseProperty) -> str:
+    """Return the entity description key for an Airios property."""
+    return ap.name.lower()
+
+
+def subentries_by_address(entry: ConfigEntry) -> dict[int, ConfigSubentry]:
+    """Return the config entry subentries indexed by node Modbus address."""
+    return {se.data[CONF_ADDRESS]: se for se in entry.subentries.values()}
+
+
+def _build_node_info(
+    coordinator: AiriosDataUpdateCoordinator,
+    modbus_address: int,
+    subentry: ConfigSubentry | None,
+) -> tuple[int, str, DeviceInfo]:
+    """Return the RF address, its hex string and the device info of a node."""
+    data = coordinator.data.nodes[modbus_address]
+
+    values = []
+    for ap, label in _REQUIRED_NODE_PROPERTIES:
+        if (result := data.get(ap)) is None:
+            msg = f"Node {label} not available"
+            raise PlatformNotReady(msg)
+        values.append(result.value)
+    (rf_address, product_name, product_id, sw_version) = values
+    rf_address_hex = f"0x{rf_address:06X}"
+
+    if coordinator.config_entry is None:
+        msg = "Unexpected error, config entry not defined"
+        raise PlatformNotReady(msg)
+
+    if not product_name:
+        product_name = rf_address_hex
+
+    if subentry is None:
+        name = product_name
+    else:
+        name = subentry.data.get("name")
+        if name is None:
+            msg = "Failed to get name from subentry"
+            raise ConfigEntryNotReady(msg)
+
+    device_info = DeviceInfo(
+        name=name,
+        serial_number=rf_address_hex,
+        identifiers={(DOMAIN, str(rf_address))},
+        manufacturer=DEFAULT_NAME,
+        model=product_name,
+        model_id=f"0x{product_id:08X}",
+        sw_version=f"0x{sw_version:04X}",
+    )
+
+    if (
+        brdg_rf_address := coordinator.bridge_rf_address
+    ) is not None and brdg_rf_address != rf_address:
+        device_info["via_device"] = (DOMAIN, str(brdg_rf_address))
+
+    return (rf_address, rf_address_hex, device_info)
 
 
 class AiriosEntity(CoordinatorEntity[AiriosDataUpdateCoordinator]):
@@ -46,6 +109,10 @@ class AiriosEntity(CoordinatorEntity[AiriosDataUpdateCoordinator]):
 
     _attr_has_entity_name = True
     _unavailable_logged: bool = False
+    _stale_polls: int = 0
+    _last_written_state: tuple[Any, ...] | None = None
+    _last_status: tuple[Any, ...] | None = None
+    _device: AiriosDevice | None = None
 
     rf_address: int
     modbus_address: int
@@ -62,60 +129,11 @@ class AiriosEntity(CoordinatorEntity[AiriosDataUpdateCoordinator]):
 
         self.modbus_address = modbus_address
 
-        data = coordinator.data.nodes[modbus_address]
-
-        if AiriosDeviceProperty.RF_ADDRESS not in data:
-            msg = "Node RF address not available"
-            raise PlatformNotReady(msg)
-        self.rf_address = data[AiriosDeviceProperty.RF_ADDRESS].value
-
-        if AiriosDeviceProperty.PRODUCT_NAME not in data:
-            msg = "Node product name not available"
-            raise PlatformNotReady(msg)
-        product_name = data[AiriosDeviceProperty.PRODUCT_NAME].value
-
-        if AiriosDeviceProperty.PRODUCT_ID not in data:
-            msg = "Node product ID not available"
-            raise PlatformNotReady(msg)
-        product_id = data[AiriosDeviceProperty.PRODUCT_ID].value
-
-        if AiriosDeviceProperty.SOFTWARE_VERSION not in data:
-            msg = "Node software version not available"
-            raise PlatformNotReady(msg)
-        sw_version = data[AiriosDeviceProperty.SOFTWARE_VERSION].value
-
-        if self.coordinator.config_entry is None:
-            msg = "Unexpected error, config entry not defined"
-            raise PlatformNotReady(msg)
-
-        if not product_name:
-            product_name = f"0x{self.rf_address:06X}"
-
-        if subentry is None:
-            name = product_name
-        else:
-            name = subentry.data.get("name")
-            if name is None:
-                msg = "Failed to get name from subentry"
-                raise ConfigEntryNotReady(msg)
-
-        self._attr_device_info = DeviceInfo(
-            name=name,
-            serial_number=f"0x{self.rf_address:06X}",
-            identifiers={(DOMAIN, str(self.rf_address))},
-            manufacturer=DEFAULT_NAME,
-            model=product_name,
-            model_id=f"0x{product_id:08X}",
-            sw_version=f"0x{sw_version:04X}",
-        )
-
-        if (
-            (r1 := coordinator.data.nodes.get(coordinator.data.bridge_key))
-            and (r2 := r1.get(AiriosDeviceProperty.RF_ADDRESS))
-            and (brdg_rf_address := r2.value)
-            and (brdg_rf_address != self.rf_address)
-        ):
-            self._attr_device_info["via_device"] = (DOMAIN, str(brdg_rf_address))
+        # All entities of a node share the same device info, build it once.
+        if (node_info := coordinator.node_info.get(modbus_address)) is None:
+            node_info = _build_node_info(coordinator, modbus_address, subentry)
+            coordinator.node_info[modbus_address] = node_info
+        (self.rf_address, self._rf_address_hex, self._attr_device_info) = node_info
 
         self._attr_unique_id = f"{self.rf_address}-{key}"
         _LOGGER.debug("Entity %s has unique id %s", key, self._attr_unique_id)
@@ -124,36 +142,92 @@ class AiriosEntity(CoordinatorEntity[AiriosDataUpdateCoordinator]):
         """Return the Airios API."""
         return self.coordinator.api
 
+    async def device(self) -> AiriosDevice:
+        """Return the Airios device handle of the node, resolving it once."""
+        if self._device is None:
+            self._device = await self.api().node(self.modbus_address)
+        return self._device
+
+    def invalidate_device(self) -> None:
+        """Drop the cached device handle so it is resolved again on next use."""
+        self._device = None
+
+    def keep_stale_state(self) -> bool:
+        """Return True if the last state can be kept after a failed read."""
+        if self._stale_polls >= self.coordinator.stale_grace:
+            return False
+        self._stale_polls += 1
+        return True
+
+    @callback
+    def async_write_ha_state_if_changed(self, value: Any) -> None:
+        """Write the state to Home Assistant only if it changed since the last write."""
+        state = (
+            value,
+            self.available,
+            getattr(self, "_attr_extra_state_attributes", None),
+        )
+        if state == self._last_written_state:
+            return
+        self._last_written_state = state
+        self.async_write_ha_state()
+
     def set_extra_state_attributes_internal(self, status: ResultStatus) -> None:
         """Set extra state attributes."""
+        status_tuple = (status.age, status.source, status.flags)
+        if status_tuple == self._last_status:
+            return
+        self._last_status = status_tuple
         self._attr_extra_state_attributes = {
             "age": str(status.age),
             "source": str(status.source),
             "flags": str(status.flags),
         }
 
-    def fetch_result(self) -> Result:
-        """Fetch result for entity."""
+    def node_data(self) -> AiriosDeviceData:
+        """Return the coordinator data of the entity node."""
+        return self.coordinator.data.nodes[self.modbus_address]
+
+    def get_result(self) -> Result | None:
+        """Get result for entity, or None if the coordinator has no value for it."""
+        description = self.entity_description
         _LOGGER.debug(
             "Updating node=%s, property=%s",
-            f"{self.rf_address}:08X",
-            self.entity_description.key,
+            self._rf_address_hex,
+            description.key,
         )
 
-        if not isinstance(self.entity_description, AiriosEntityDescription):
+        if not isinstance(description, AiriosEntityDescription):
             msg = "Expected Airios entity description"
             raise TypeError(msg)
 
-        ap = typing.cast("AiriosEntityDescription", self.entity_description).ap
-        data = self.coordinator.data.nodes[self.modbus_address]
-        result = data[ap]
+        result = self.node_data().get(description.ap)
         _LOGGER.debug(
             "Node=%s, property=%s, result=%s",
-            f"0x{self.rf_address:08X}",
-            self.entity_description.key,
+            self._rf_address_hex,
+            description.key,
             result,
         )
         if result is None or result.value is None:
+            return None
+        return result
+
+    @callback
+    def apply_value(self, value: Any) -> None:
+        """
+        Reflect a value accepted by the device in the coordinator data.
+
+        Avoids polling all nodes just to read back the new value; the next
+        scheduled poll confirms it.
+        """
+        ap = cast("AiriosEntityDescription", self.entity_description).ap
+        if (result := self.node_data().get(ap)) is not None:
+            result.value = value
+        self.coordinator.async_update_listeners()
+
+    def fetch_result(self) -> Result:
+        """Fetch result for entity."""
+        if (result := self.get_result()) is None:
             msg = f"{self.entity_description.key} result not exists"
             raise ValueError(msg)
         return result
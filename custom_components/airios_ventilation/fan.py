@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import typing
 from dataclasses import dataclass
-from typing import Any, final
+from typing import TYPE_CHECKING, Any, final
 
 from homeassistant.components.fan import (
     FanEntity,
@@ -29,7 +29,8 @@ from pyairios.properties import (
 from .entity import (
     AiriosEntity,
     AiriosEntityDescription,
-    find_matching_subentry,
+    entity_key,
+    subentries_by_address,
 )
 from .services import (
     SERVICE_FILTER_RESET,
@@ -42,7 +43,7 @@ from .services import (
     SERVICE_SET_PRESET_MODE_DURATION,
 )
 
-if typing.TYPE_CHECKING:
+if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigSubentry
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
 
@@ -68,6 +69,47 @@ PRESET_NAMES = {
 
 PRESET_VALUES = {value: key for (key, value) in PRESET_NAMES.items()}
 
+_PRESET_OFF = PRESET_NAMES[VMDVentilationSpeed.OFF]
+_PRESET_LOW = PRESET_NAMES[VMDVentilationSpeed.LOW]
+_PRESET_MID = PRESET_NAMES[VMDVentilationSpeed.MID]
+_PRESET_HIGH = PRESET_NAMES[VMDVentilationSpeed.HIGH]
+_PRESET_OVERRIDE_LOW = PRESET_NAMES[VMDVentilationSpeed.OVERRIDE_LOW]
+_PRESET_OVERRIDE_MID = PRESET_NAMES[VMDVentilationSpeed.OVERRIDE_MID]
+_PRESET_OVERRIDE_HIGH = PRESET_NAMES[VMDVentilationSpeed.OVERRIDE_HIGH]
+_PRESET_AWAY = PRESET_NAMES[VMDVentilationSpeed.AWAY]
+_PRESET_BOOST = PRESET_NAMES[VMDVentilationSpeed.BOOST]
+_PRESET_AUTO = PRESET_NAMES[VMDVentilationSpeed.AUTO]
+
+# Preset modes available in addition to low, medium and high per capability
+_CAPABILITY_PRESETS: tuple[tuple[VMDCapabilities, tuple[str, ...]], ...] = (
+    (VMDCapabilities.OFF_CAPABLE, (_PRESET_OFF,)),
+    (VMDCapabilities.AUTO_MODE_CAPABLE, (_PRESET_AUTO,)),
+    (VMDCapabilities.AWAY_MODE_CAPABLE, (_PRESET_AWAY,)),
+    (VMDCapabilities.BOOST_MODE_CAPABLE, (_PRESET_BOOST,)),
+    (
+        VMDCapabilities.TIMER_CAPABLE,
+        (_PRESET_OVERRIDE_LOW, _PRESET_OVERRIDE_MID, _PRESET_OVERRIDE_HIGH),
+    ),
+)
+
+_PRESET_MODE_DURATION_PROPERTIES = frozenset(
+    {AiriosVMDProperty.REQUESTED_VENTILATION_SPEED, AiriosVMDProperty.CAPABILITIES}
+)
+
+# Override time properties of the temporary override presets, set for 60 minutes
+_PRESET_OVERRIDE_PROPERTIES: dict[str, AiriosVMDProperty] = {
+    _PRESET_OVERRIDE_LOW: AiriosVMDProperty.OVERRIDE_TIME_SPEED_LOW,
+    _PRESET_OVERRIDE_MID: AiriosVMDProperty.OVERRIDE_TIME_SPEED_MID,
+    _PRESET_OVERRIDE_HIGH: AiriosVMDProperty.OVERRIDE_TIME_SPEED_HIGH,
+}
+
+# Override time properties of the presets with a configurable duration
+_PRESET_DURATION_PROPERTIES: dict[str, AiriosVMDProperty] = {
+    _PRESET_LOW: AiriosVMDProperty.OVERRIDE_TIME_SPEED_LOW,
+    _PRESET_MID: AiriosVMDProperty.OVERRIDE_TIME_SPEED_MID,
+    _PRESET_HIGH: AiriosVMDProperty.OVERRIDE_TIME_SPEED_HIGH,
+}
+
 PRESET_TO_VMD_SPEED = {
     "off": VMDRequestedVentilationSpeed.OFF,
     "low": VMDRequestedVentilationSpeed.LOW,
@@ -90,7 +132,7 @@ class AiriosFanEntityDescription(AiriosEntityDescription, FanEntityDescription):
 FAN_ENTITIES: tuple[AiriosFanEntityDescription, ...] = (
     AiriosFanEntityDescription(
         ap=AiriosVMDProperty.CURRENT_VENTILATION_SPEED,
-        key=AiriosVMDProperty.CURRENT_VENTILATION_SPEED.name.casefold(),
+        key=entity_key(AiriosVMDProperty.CURRENT_VENTILATION_SPEED),
         translation_key="ventilation_speed",
     ),
 )
@@ -103,13 +145,14 @@ async def async_setup_entry(
 ) -> None:
     """Set up the number entities."""
     coordinator: AiriosDataUpdateCoordinator = entry.runtime_data
+    subentries = subentries_by_address(entry)
 
     for modbus_address, node in coordinator.data.nodes.items():
         capabilities = None
         if AiriosVMDProperty.CAPABILITIES in node:
             capabilities = node[AiriosVMDProperty.CAPABILITIES].value
 
-        subentry = find_matching_subentry(entry, modbus_address)
+        subentry = subentries.get(modbus_address)
         entities: list[AiriosFanEntity] = [
             AiriosFanEntity(
                 description, coordinator, capabilities, modbus_address, subentry
@@ -134,12 +177,12 @@ async def async_setup_entry(
     platform.async_register_entity_service(
         SERVICE_SET_PRESET_FAN_SPEED_MEDIUM,
         SERVICE_SCHEMA_SET_PRESET_FAN_SPEED,
-        "async_set_preset_fan_speed_low",
+        "async_set_preset_fan_speed_medium",
     )
     platform.async_register_entity_service(
         SERVICE_SET_PRESET_FAN_SPEED_HIGH,
         SERVICE_SCHEMA_SET_PRESET_FAN_SPEED,
-        "async_set_preset_fan_speed_low",
+        "async_set_preset_fan_speed_high",
     )
     platform.async_register_entity_service(
         SERVICE_SET_PRESET_MODE_DURATION,
@@ -183,85 +226,65 @@ class AiriosFanEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
             capabilities,
         )
 
-        self._attr_preset_modes = [
-            PRESET_NAMES[VMDVentilationSpeed.LOW],
-            PRESET_NAMES[VMDVentilationSpeed.MID],
-            PRESET_NAMES[VMDVentilationSpeed.HIGH],
-        ]
+        self._attr_preset_modes = [_PRESET_LOW, _PRESET_MID, _PRESET_HIGH]
 
         if capabilities:
             if VMDCapabilities.OFF_CAPABLE in capabilities:
                 self._attr_supported_features |= FanEntityFeature.TURN_OFF
                 self._attr_supported_features |= FanEntityFeature.TURN_ON
-                self._attr_preset_modes.append(PRESET_NAMES[VMDVentilationSpeed.OFF])
-
-            if VMDCapabilities.AUTO_MODE_CAPABLE in capabilities:
-                self._attr_preset_modes.append(PRESET_NAMES[VMDVentilationSpeed.AUTO])
-            if VMDCapabilities.AWAY_MODE_CAPABLE in capabilities:
-                self._attr_preset_modes.append(PRESET_NAMES[VMDVentilationSpeed.AWAY])
-            if VMDCapabilities.BOOST_MODE_CAPABLE in capabilities:
-                self._attr_preset_modes.append(PRESET_NAMES[VMDVentilationSpeed.BOOST])
-            if VMDCapabilities.TIMER_CAPABLE in capabilities:
-                self._attr_preset_modes.append(
-                    PRESET_NAMES[VMDVentilationSpeed.OVERRIDE_LOW]
-                )
-                self._attr_preset_modes.append(
-                    PRESET_NAMES[VMDVentilationSpeed.OVERRIDE_MID]
-                )
-                self._attr_preset_modes.append(
-                    PRESET_NAMES[VMDVentilationSpeed.OVERRIDE_HIGH]
-                )
+
+            self._attr_preset_modes.extend(
+                preset
+                for capability, presets in _CAPABILITY_PRESETS
+                if capability in capabilities
+                for preset in presets
+            )
 
     async def _turn_on_internal(
         self,
         percentage: int | None = None,  # noqa: ARG002 # pylint: disable=unused-argument
         preset_mode: str | None = None,
-    ) -> bool:
+    ) -> None:
         if self.is_on:
-            return False
+            return
         if preset_mode is None:
-            preset_mode = PRESET_NAMES[VMDVentilationSpeed.MID]
-        return await self._set_preset_mode_internal(preset_mode)
+            preset_mode = _PRESET_MID
+        await self._set_preset_mode_internal(preset_mode)
 
-    async def _turn_off_internal(self) -> bool:
+    async def _turn_off_internal(self) -> None:
         if not self.is_on:
-            return False
-        return await self._set_preset_mode_internal(
-            PRESET_NAMES[VMDVentilationSpeed.OFF]
-        )
+            return
+        await self._set_preset_mode_internal(_PRESET_OFF)
 
-    async def _set_preset_mode_internal(self, preset_mode: str) -> bool:
+    async def _set_preset_mode_internal(self, preset_mode: str) -> None:
         if preset_mode == self.preset_mode:
-            return False
+            return
 
         try:
-            dev = await self.api().node(self.modbus_address)
+            dev = await self.device()
             vmd_speed = PRESET_TO_VMD_SPEED[preset_mode]
 
             # Handle temporary overrides
-            if preset_mode == PRESET_NAMES[VMDVentilationSpeed.OVERRIDE_LOW]:
-                return await dev.set(AiriosVMDProperty.OVERRIDE_TIME_SPEED_LOW, 60)
-
-            if preset_mode == PRESET_NAMES[VMDVentilationSpeed.OVERRIDE_MID]:
-                return await dev.set(AiriosVMDProperty.OVERRIDE_TIME_SPEED_MID, 60)
-
-            if preset_mode == PRESET_NAMES[VMDVentilationSpeed.OVERRIDE_HIGH]:
-                return await dev.set(AiriosVMDProperty.OVERRIDE_TIME_SPEED_HIGH, 60)
-
-            return await dev.set(
-                AiriosVMDProperty.REQUESTED_VENTILATION_SPEED, vmd_speed
-            )
+            if (
+                override_ap := _PRESET_OVERRIDE_PROPERTIES.get(preset_mode)
+            ) is not None:
+                accepted = await dev.set(override_ap, 60)
+            else:
+                accepted = await dev.set(
+                    AiriosVMDProperty.REQUESTED_VENTILATION_SPEED, vmd_speed
+                )
         except AiriosException as ex:
+            self.invalidate_device()
             msg = f"Failed to set preset {preset_mode}"
             raise HomeAssistantError(msg) from ex
 
+        if accepted:
+            self.apply_value(PRESET_VALUES[preset_mode])
+
     @property
     def is_on(self) -> bool | None:
         """Return true if the entity is on."""
-        return (
-            self.preset_mode is not None
-            and self.preset_mode != PRESET_NAMES[VMDVentilationSpeed.OFF]
-        )
+        return self.preset_mode is not None and self.preset_mode != _PRESET_OFF
 
     async def async_turn_on(
         self,
@@ -270,87 +293,104 @@ class AiriosFanEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
         **kwargs: Any,  # noqa: ARG002 # pylint: disable=unused-argument
     ) -> None:
         """Turn on the fan."""
-        update_needed = await self._turn_on_internal(percentage, preset_mode)
-        if update_needed:
-            await self.coordinator.async_request_refresh()
+        await self._turn_on_internal(percentage, preset_mode)
 
     async def async_turn_off(self, **kwargs: Any) -> None:  # noqa: ARG002 # pylint: disable=unused-argument
         """Turn off the fan."""
-        update_needed = await self._turn_off_internal()
-        if update_needed:
-            await self.coordinator.async_request_refresh()
+        await self._turn_off_internal()
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
-        update_needed = await self._set_preset_mode_internal(preset_mode)
-        if update_needed:
-            await self.coordinator.async_request_refresh()
+        await self._set_preset_mode_internal(preset_mode)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle update data from the coordinator."""
         try:
             result = self.fetch_result()
-            self._attr_preset_mode = PRESET_NAMES[result.value]
+            self._attr_preset_mode = PRESET_NAMES.get(result.value)
             self._attr_available = self._attr_preset_mode is not None
+            self._stale_polls = 0
             if result is not None and result.status is not None:
                 self.set_extra_state_attributes_internal(result.status)
         except (TypeError, ValueError) as ex:
             _LOGGER.info(
                 "Failed to update fan entity for node=%s, property=%s: %s",
-                f"0x{self.rf_address:08X}",
+                self._rf_address_hex,
                 self.entity_description.key,
                 ex,
             )
-            self._attr_available = False
+            if self._attr_preset_mode is None or not self.keep_stale_state():
+                self._attr_available = False
         finally:
             if self._attr_available:
                 self._unavailable_logged = False
             elif not self._unavailable_logged:
                 _LOGGER.info(
                     "Node %s fan %s is unavailable",
-                    f"0x{self.rf_address:08X}",
+                    self._rf_address_hex,
                     self.entity_description.key,
                 )
                 self._unavailable_logged = True
-            self.async_write_ha_state()
+            self.async_write_ha_state_if_changed(self._attr_preset_mode)
 
-    @final
-    async def async_set_preset_fan_speed_away(
+    async def _set_preset_fan_speeds(
         self,
+        preset: str,
+        supply_ap: AiriosVMDProperty,
+        exhaust_ap: AiriosVMDProperty,
         supply_fan_speed: int,
         exhaust_fan_speed: int,
     ) -> bool:
-        """Set the fans speeds for the away preset mode."""
-        dev = await self.api().node(self.modbus_address)
-        data = self.coordinator.data.nodes[self.modbus_address]
-        if (
-            AiriosVMDProperty.FAN_SPEED_AWAY_SUPPLY,
-            AiriosVMDProperty.FAN_SPEED_AWAY_EXHAUST,
-        ) not in data:
+        """Set the supply and exhaust fans speeds for a preset mode."""
+        dev = await self.device()
+        data = self.node_data()
+        if supply_ap not in data or exhaust_ap not in data:
             msg = f"Property not supported by device {dev!s}."
             raise HomeAssistantError(msg)
-        msg = (
-            "Setting fans speeds for away preset on node "
-            f"{dev} to: supply={supply_fan_speed}%%, exhaust={exhaust_fan_speed}%%"
+        _LOGGER.info(
+            "Setting fans speeds for %s preset on node %s to: "
+            "supply=%s%%, exhaust=%s%%",
+            preset,
+            dev,
+            supply_fan_speed,
+            exhaust_fan_speed,
         )
-        _LOGGER.info(msg)
         try:
-            if not await dev.set(
-                AiriosVMDProperty.FAN_SPEED_AWAY_SUPPLY, supply_fan_speed
-            ):
-                msg = f"Failed to set supply fan speed to {supply_fan_speed}"
-                raise HomeAssistantError(msg)
-            if not await dev.set(
-                AiriosVMDProperty.FAN_SPEED_AWAY_EXHAUST, exhaust_fan_speed
-            ):
-                msg = f"Failed to set exhaust fan speed to {exhaust_fan_speed}"
-                raise HomeAssistantError(msg)
+            # The client serializes the two writes on the bus, but issuing them
+            # together avoids waiting for the first to return before queuing
+            # the second.
+            supply_ok, exhaust_ok = await asyncio.gather(
+                dev.set(supply_ap, supply_fan_speed),
+                dev.set(exhaust_ap, exhaust_fan_speed),
+            )
         except AiriosException as ex:
+            self.invalidate_device()
             msg = f"Failed to set fan speeds: {ex}"
             raise HomeAssistantError(msg) from ex
+        if not supply_ok:
+            msg = f"Failed to set supply fan speed to {supply_fan_speed}"
+            raise HomeAssistantError(msg)
+        if not exhaust_ok:
+            msg = f"Failed to set exhaust fan speed to {exhaust_fan_speed}"
+            raise HomeAssistantError(msg)
         return True
 
+    @final
+    async def async_set_preset_fan_speed_away(
+        self,
+        supply_fan_speed: int,
+        exhaust_fan_speed: int,
+    ) -> bool:
+        """Set the fans speeds for the away preset mode."""
+        return await self._set_preset_fan_speeds(
+            "away",
+            AiriosVMDProperty.FAN_SPEED_AWAY_SUPPLY,
+            AiriosVMDProperty.FAN_SPEED_AWAY_EXHAUST,
+            supply_fan_speed,
+            exhaust_fan_speed,
+        )
+
     @final
     async def async_set_preset_fan_speed_low(
         self,
@@ -358,34 +398,13 @@ class AiriosFanEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
         exhaust_fan_speed: int,
     ) -> bool:
         """Set the fans speeds for the low preset mode."""
-        dev = await self.api().node(self.modbus_address)
-        data = self.coordinator.data.nodes[self.modbus_address]
-        if (
+        return await self._set_preset_fan_speeds(
+            "low",
             AiriosVMDProperty.FAN_SPEED_LOW_SUPPLY,
             AiriosVMDProperty.FAN_SPEED_LOW_EXHAUST,
-        ) not in data:
-            msg = f"Property not supported by device {dev!s}."
-            raise HomeAssistantError(msg)
-        infomsg = (
-            "Setting fans speeds for low preset on node "
-            f"{dev} to: supply={supply_fan_speed}%%, exhaust={exhaust_fan_speed}%%",
+            supply_fan_speed,
+            exhaust_fan_speed,
         )
-        _LOGGER.info(infomsg)
-        try:
-            if not await dev.set(
-                AiriosVMDProperty.FAN_SPEED_LOW_SUPPLY, supply_fan_speed
-            ):
-                msg = f"Failed to set supply fan speed to {supply_fan_speed}"
-                raise HomeAssistantError(msg)
-            if not await dev.set(
-                AiriosVMDProperty.FAN_SPEED_LOW_EXHAUST, exhaust_fan_speed
-            ):
-                msg = f"Failed to set exhaust fan speed to {supply_fan_speed}"
-                raise HomeAssistantError(msg)
-        except AiriosException as ex:
-            msg = f"Failed to set fan speeds: {ex}"
-            raise HomeAssistantError(msg) from ex
-        return True
 
     @final
     async def async_set_preset_fan_speed_medium(
@@ -394,34 +413,13 @@ class AiriosFanEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
         exhaust_fan_speed: int,
     ) -> bool:
         """Set the fans speeds for the medium preset mode."""
-        dev = await self.api().node(self.modbus_address)
-        data = self.coordinator.data.nodes[self.modbus_address]
-        if (
+        return await self._set_preset_fan_speeds(
+            "medium",
             AiriosVMDProperty.FAN_SPEED_MID_SUPPLY,
             AiriosVMDProperty.FAN_SPEED_MID_EXHAUST,
-        ) not in data:
-            msg = f"Property not supported by device {dev!s}."
-            raise HomeAssistantError(msg)
-        infomsg = (
-            "Setting fans speeds for medium preset on node "
-            f"{dev} to: supply={supply_fan_speed}%%, exhaust={exhaust_fan_speed}%%",
+            supply_fan_speed,
+            exhaust_fan_speed,
         )
-        _LOGGER.info(infomsg)
-        try:
-            if not await dev.set(
-                AiriosVMDProperty.FAN_SPEED_MID_SUPPLY, supply_fan_speed
-            ):
-                msg = f"Failed to set supply fan speed to {supply_fan_speed}"
-                raise HomeAssistantError(msg)
-            if not await dev.set(
-                AiriosVMDProperty.FAN_SPEED_MID_EXHAUST, exhaust_fan_speed
-            ):
-                msg = f"Failed to set exhaust fan speed to {supply_fan_speed}"
-                raise HomeAssistantError(msg)
-        except AiriosException as ex:
-            msg = f"Failed to set fan speeds: {ex}"
-            raise HomeAssistantError(msg) from ex
-        return True
 
     @final
     async def async_set_preset_fan_speed_high(
@@ -430,57 +428,35 @@ class AiriosFanEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
         exhaust_fan_speed: int,
     ) -> bool:
         """Set the fans speeds for the high preset mode."""
-        dev = await self.api().node(self.modbus_address)
-        data = self.coordinator.data.nodes[self.modbus_address]
-        if (
+        return await self._set_preset_fan_speeds(
+            "high",
             AiriosVMDProperty.FAN_SPEED_HIGH_SUPPLY,
             AiriosVMDProperty.FAN_SPEED_HIGH_EXHAUST,
-        ) not in data:
-            msg = f"Property not supported by device {dev!s}."
-            raise HomeAssistantError(msg)
-
-        infomsg = (
-            "Setting fans speeds for high preset on node "
-            f"{dev} to: supply={supply_fan_speed}%%, exhaust={exhaust_fan_speed}%%",
+            supply_fan_speed,
+            exhaust_fan_speed,
         )
-        _LOGGER.info(infomsg)
-        try:
-            dev = await self.api().node(self.modbus_address)
-            if not await dev.set(
-                AiriosVMDProperty.FAN_SPEED_HIGH_SUPPLY, supply_fan_speed
-            ):
-                msg = f"Failed to set supply fan speed to {supply_fan_speed}"
-                raise HomeAssistantError(msg)
-            if not await dev.set(
-                AiriosVMDProperty.FAN_SPEED_HIGH_EXHAUST, exhaust_fan_speed
-            ):
-                msg = f"Failed to set exhaust fan speed to {supply_fan_speed}"
-                raise HomeAssistantError(msg)
-        except AiriosException as ex:
-            msg = f"Failed to set fan speeds: {ex}"
-            raise HomeAssistantError(msg) from ex
-        return True
 
     @final
     async def async_set_preset_mode_duration(
         self, preset_mode: str, preset_override_time: int
     ) -> bool:
         """Set the preset mode for a limited time."""
-        dev = await self.api().node(self.modbus_address)
-        data = self.coordinator.data.nodes[self.modbus_address]
-        if (
-            AiriosVMDProperty.REQUESTED_VENTILATION_SPEED,
-            AiriosVMDProperty.CAPABILITIES,
-        ) not in data:
+        dev = await self.device()
+        data = self.node_data()
+        if not _PRESET_MODE_DURATION_PROPERTIES.issubset(data):
             msg = f"Property not supported by device {dev!s}."
             raise HomeAssistantError(msg)
 
         caps = data[AiriosVMDProperty.CAPABILITIES].value
-        if VMDCapabilities.TIMER_CAPABLE not in caps:
+        if not caps or VMDCapabilities.TIMER_CAPABLE not in caps:
             msg = f"Device {dev!s} does not support preset temporary override"
             raise HomeAssistantError(msg)
 
         vmd_speed = PRESET_TO_VMD_SPEED[preset_mode]
+        if (override_ap := _PRESET_DURATION_PROPERTIES.get(preset_mode)) is None:
+            msg = f"Temporary override not available for preset [{preset_mode}]"
+            raise HomeAssistantError(msg)
+
         _LOGGER.info(
             "Setting preset mode on node %s to: %s for %s minutes",
             str(dev),
@@ -488,29 +464,17 @@ class AiriosFanEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
             preset_override_time,
         )
         try:
-            if preset_mode == PRESET_NAMES[VMDVentilationSpeed.LOW]:
-                return await dev.set(
-                    AiriosVMDProperty.OVERRIDE_TIME_SPEED_LOW, preset_override_time
-                )
-            if preset_mode == PRESET_NAMES[VMDVentilationSpeed.MID]:
-                return await dev.set(
-                    AiriosVMDProperty.OVERRIDE_TIME_SPEED_MID, preset_override_time
-                )
-            if preset_mode == PRESET_NAMES[VMDVentilationSpeed.HIGH]:
-                return await dev.set(
-                    AiriosVMDProperty.OVERRIDE_TIME_SPEED_HIGH, preset_override_time
-                )
-            msg = f"Temporary override not available for preset [{preset_mode}]"
-            raise HomeAssistantError(msg)
+            return await dev.set(override_ap, preset_override_time)
         except AiriosException as ex:
+            self.invalidate_device()
             msg = f"Failed to set temporary preset override: {ex}"
             raise HomeAssistantError(msg) from ex
 
     @final
     async def async_filter_reset(self) -> bool:
         """Reset the filter dirty flag."""
-        dev = await self.api().node(self.modbus_address)
-        data = self.coordinator.data.nodes[self.modbus_address]
+        dev = await self.device()
+        data = self.node_data()
         ap = AiriosVMDProperty.FILTER_RESET
         if ap not in data:
             msg = f"Property {ap.name} not supported by device {dev!s}."
@@ -522,6 +486,7 @@ class AiriosFanEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
                 msg = "Failed to reset filter dirty flag"
                 raise HomeAssistantError(msg)
         except AiriosException as ex:
+            self.invalidate_device()
             msg = f"Failed to reset filter dirty flag: {ex}"
             raise HomeAssistantError(msg) from ex
         return True
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import logging
-import typing
+from collections import defaultdict
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
 
 from homeassistant.components.number import (
     NumberDeviceClass,
@@ -18,20 +19,21 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from pyairios.exceptions import AiriosException
 from pyairios.properties import AiriosVMDProperty
 
 from .entity import (
     AiriosEntity,
     AiriosEntityDescription,
-    find_matching_subentry,
+    entity_key,
+    subentries_by_address,
 )
 
-if typing.TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
-
+if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry, ConfigSubentry
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
-    from pyairios.device import AiriosDevice
+    from pyairios.properties import AiriosBaseProperty
 
     from .coordinator import AiriosDataUpdateCoordinator
 
@@ -40,44 +42,15 @@ _LOGGER = logging.getLogger(__name__)
 PARALLEL_UPDATES = 0
 
 
-async def set_preheater_setpoint(vmd: AiriosDevice, value: float) -> bool:
-    """Set the preheater setpoint."""
-    return await vmd.set(AiriosVMDProperty.PREHEATER_SETPOINT, value)
-
-
-async def set_free_ventilation_setpoint(vmd: AiriosDevice, value: float) -> bool:
-    """Set the preheater setpoint."""
-    return await vmd.set(AiriosVMDProperty.FREE_VENTILATION_HEATING_SETPOINT, value)
-
-
-async def set_free_ventilation_cooling_offset(vmd: AiriosDevice, value: float) -> bool:
-    """Set the preheater setpoint."""
-    return await vmd.set(AiriosVMDProperty.FREE_VENTILATION_COOLING_OFFSET, value)
-
-
-async def set_frost_protection_preheater_setpoint(
-    vmd: AiriosDevice, value: float
-) -> bool:
-    """Set the preheater setpoint."""
-    return await vmd.set(AiriosVMDProperty.FROST_PROTECTION_PREHEATER_SETPOINT, value)
-
-
-async def set_co2_setpoint(vmd: AiriosDevice, value: float) -> bool:
-    """Set the CO2 setpoint."""
-    return await vmd.set(AiriosVMDProperty.CO2_CONTROL_SETPOINT, value)
-
-
 @dataclass(frozen=True, kw_only=True)
 class AiriosNumberEntityDescription(AiriosEntityDescription, NumberEntityDescription):
     """Description of a Airios number entity."""
 
-    set_value_fn: Callable[[AiriosDevice, float], Awaitable[bool]]
-
 
 NUMBER_ENTITIES: tuple[AiriosNumberEntityDescription, ...] = (
     AiriosNumberEntityDescription(
         ap=AiriosVMDProperty.PREHEATER_SETPOINT,
-        key=AiriosVMDProperty.PREHEATER_SETPOINT.name.casefold(),
+        key=entity_key(AiriosVMDProperty.PREHEATER_SETPOINT),
         translation_key="preheater_setpoint",
         native_min_value=-20.0,
         native_max_value=50.0,
@@ -86,11 +59,10 @@ NUMBER_ENTITIES: tuple[AiriosNumberEntityDescription, ...] = (
         native_step=1.0,
         entity_category=EntityCategory.CONFIG,
         mode=NumberMode.BOX,
-        set_value_fn=set_preheater_setpoint,
     ),
     AiriosNumberEntityDescription(
         ap=AiriosVMDProperty.FROST_PROTECTION_PREHEATER_SETPOINT,
-        key=AiriosVMDProperty.FROST_PROTECTION_PREHEATER_SETPOINT.name.casefold(),
+        key=entity_key(AiriosVMDProperty.FROST_PROTECTION_PREHEATER_SETPOINT),
         translation_key="frost_protection_preheater_setpoint",
         native_min_value=-20.0,
         native_max_value=50.0,
@@ -99,11 +71,10 @@ NUMBER_ENTITIES: tuple[AiriosNumberEntityDescription, ...] = (
         native_step=1.0,
         entity_category=EntityCategory.CONFIG,
         mode=NumberMode.BOX,
-        set_value_fn=set_frost_protection_preheater_setpoint,
     ),
     AiriosNumberEntityDescription(
         ap=AiriosVMDProperty.FREE_VENTILATION_HEATING_SETPOINT,
-        key=AiriosVMDProperty.FREE_VENTILATION_HEATING_SETPOINT.name.casefold(),
+        key=entity_key(AiriosVMDProperty.FREE_VENTILATION_HEATING_SETPOINT),
         translation_key="free_ventilation_setpoint",
         native_min_value=0.0,
         native_max_value=30.0,
@@ -112,23 +83,21 @@ NUMBER_ENTITIES: tuple[AiriosNumberEntityDescription, ...] = (
         native_step=1.0,
         entity_category=EntityCategory.CONFIG,
         mode=NumberMode.BOX,
-        set_value_fn=set_free_ventilation_setpoint,
     ),
     AiriosNumberEntityDescription(
         ap=AiriosVMDProperty.FREE_VENTILATION_COOLING_OFFSET,
-        key=AiriosVMDProperty.FREE_VENTILATION_COOLING_OFFSET.name.casefold(),
+        key=entity_key(AiriosVMDProperty.FREE_VENTILATION_COOLING_OFFSET),
         translation_key="free_ventilation_cooling_offset",
         native_min_value=1.0,
         native_max_value=10.0,
         native_step=1.0,
         entity_category=EntityCategory.CONFIG,
         mode=NumberMode.BOX,
-        set_value_fn=set_free_ventilation_cooling_offset,
     ),
     # VMD07-RP13 specific
     AiriosNumberEntityDescription(
         ap=AiriosVMDProperty.CO2_CONTROL_SETPOINT,
-        key=AiriosVMDProperty.CO2_CONTROL_SETPOINT.name.casefold(),
+        key=entity_key(AiriosVMDProperty.CO2_CONTROL_SETPOINT),
         translation_key="co2_setpoint",
         native_min_value=400,
         native_max_value=2300,
@@ -136,10 +105,13 @@ NUMBER_ENTITIES: tuple[AiriosNumberEntityDescription, ...] = (
         native_step=1,
         entity_category=EntityCategory.CONFIG,
         mode=NumberMode.BOX,
-        set_value_fn=set_co2_setpoint,
     ),
 )
 
+NUMBER_ENTITIES_BY_AP: dict[AiriosBaseProperty, AiriosNumberEntityDescription] = {
+    description.ap: description for description in NUMBER_ENTITIES
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,  # noqa: ARG001 # pylint: disable=unused-argument
@@ -148,16 +120,22 @@ async def async_setup_entry(
 ) -> None:
     """Set up the number entities."""
     coordinator: AiriosDataUpdateCoordinator = entry.runtime_data
+    subentries = subentries_by_address(entry)
 
+    entities: dict[str | None, list[AiriosNumberEntity]] = defaultdict(list)
     for modbus_address, node in coordinator.data.nodes.items():
-        subentry = find_matching_subentry(entry, modbus_address)
-        entities: list[AiriosNumberEntity] = [
-            AiriosNumberEntity(description, coordinator, modbus_address, subentry)
-            for description in NUMBER_ENTITIES
-            if description.ap in node
-        ]
+        if NUMBER_ENTITIES_BY_AP.keys().isdisjoint(node):
+            continue
+        subentry = subentries.get(modbus_address)
         subentry_id = subentry.subentry_id if subentry else None
-        async_add_entities(entities, config_subentry_id=subentry_id)
+        entities[subentry_id].extend(
+            AiriosNumberEntity(description, coordinator, modbus_address, subentry)
+            for ap in node
+            if (description := NUMBER_ENTITIES_BY_AP.get(ap))
+        )
+
+    for subentry_id, subentry_entities in entities.items():
+        async_add_entities(subentry_entities, config_subentry_id=subentry_id)
 
 
 class AiriosNumberEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
@@ -178,19 +156,23 @@ class AiriosNumberEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
         """Initialize a Airios number entity."""
         super().__init__(description.key, coordinator, modbus_address, subentry)
         self.entity_description = description  # type: ignore[override]
-        self._attr_current_option = None
 
     async def _set_value_internal(self, value: float) -> bool:
-        if self.entity_description.set_value_fn is None:
-            raise NotImplementedError
-        dev = await self.api().node(self.modbus_address)
-        return await self.entity_description.set_value_fn(dev, value)
+        # A value kept during the grace period may no longer match the device
+        if self._stale_polls == 0 and value == self.native_value:
+            return False
+        try:
+            dev = await self.device()
+            return await dev.set(self.entity_description.ap, value)
+        except AiriosException as ex:
+            self.invalidate_device()
+            msg = f"Failed to set {self.entity_description.key} to {value}"
+            raise HomeAssistantError(msg) from ex
 
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        update_needed = await self._set_value_internal(value)
-        if update_needed:
-            await self.coordinator.async_request_refresh()
+        if await self._set_value_internal(value):
+            self.apply_value(value)
 
     @callback
     def _handle_coordinator_update(self) -> None:
@@ -199,16 +181,18 @@ class AiriosNumberEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
             result = self.fetch_result()
             self._attr_native_value = result.value
             self._attr_available = self._attr_native_value is not None
+            self._stale_polls = 0
             if result.status is not None:
                 self.set_extra_state_attributes_internal(result.status)
         except (TypeError, ValueError) as ex:
             _LOGGER.info(
                 "Failed to update number entity for node=%s, property=%s: %s",
-                f"0x{self.rf_address:06X}",
+                self._rf_address_hex,
                 self.entity_description.key,
                 ex,
             )
-            self._attr_current_option = None
-            self._attr_available = False
+            if self._attr_native_value is None or not self.keep_stale_state():
+                self._attr_native_value = None
+                self._attr_available = False
         finally:
-            self.async_write_ha_state()
+            self.async_write_ha_state_if_changed(self._attr_native_value)
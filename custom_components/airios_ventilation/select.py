@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import logging
-import typing
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.core import HomeAssistant, callback
@@ -17,15 +17,18 @@ from pyairios.properties import AiriosVMDProperty
 from .entity import (
     AiriosEntity,
     AiriosEntityDescription,
-    find_matching_subentry,
+    entity_key,
+    subentries_by_address,
 )
 
-if typing.TYPE_CHECKING:
+if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
+    from typing import Any
 
     from homeassistant.config_entries import ConfigEntry, ConfigSubentry
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
     from pyairios.device import AiriosDevice
+    from pyairios.properties import AiriosBaseProperty
 
     from .coordinator import AiriosDataUpdateCoordinator
 
@@ -39,6 +42,7 @@ class AiriosSelectEntityDescription(AiriosEntityDescription, SelectEntityDescrip
     """Airios select description."""
 
     value_fn: Callable[[Any], str | None]
+    option_value_fn: Callable[[str], Any]
     set_value_fn: Callable[[AiriosDevice, str], Awaitable[bool]]
 
 
@@ -59,14 +63,19 @@ async def _set_bypass_mode_fn(dev: AiriosDevice, option: str) -> bool:
 SELECT_ENTITIES: tuple[AiriosSelectEntityDescription, ...] = (
     AiriosSelectEntityDescription(
         ap=AiriosVMDProperty.BYPASS_MODE,
-        key=AiriosVMDProperty.BYPASS_MODE.name.casefold(),
+        key=entity_key(AiriosVMDProperty.BYPASS_MODE),
         translation_key="bypass_mode",
         options=["close", "open", "auto"],
         value_fn=BYPASS_MODE_TO_NAME.get,
+        option_value_fn=NAME_TO_BYPASS_MODE.get,
         set_value_fn=_set_bypass_mode_fn,
     ),
 )
 
+SELECT_ENTITIES_BY_AP: dict[AiriosBaseProperty, AiriosSelectEntityDescription] = {
+    description.ap: description for description in SELECT_ENTITIES
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,  # noqa: ARG001 # pylint: disable=unused-argument
@@ -75,16 +84,22 @@ async def async_setup_entry(
 ) -> None:
     """Set up the selectors."""
     coordinator: AiriosDataUpdateCoordinator = entry.runtime_data
+    subentries = subentries_by_address(entry)
 
+    entities: dict[str | None, list[AiriosSelectEntity]] = defaultdict(list)
     for modbus_address, node in coordinator.data.nodes.items():
-        subentry = find_matching_subentry(entry, modbus_address)
-        entities: list[AiriosSelectEntity] = [
-            AiriosSelectEntity(description, coordinator, modbus_address, subentry)
-            for description in SELECT_ENTITIES
-            if description.ap in node
-        ]
+        if SELECT_ENTITIES_BY_AP.keys().isdisjoint(node):
+            continue
+        subentry = subentries.get(modbus_address)
         subentry_id = subentry.subentry_id if subentry else None
-        async_add_entities(entities, config_subentry_id=subentry_id)
+        entities[subentry_id].extend(
+            AiriosSelectEntity(description, coordinator, modbus_address, subentry)
+            for ap in node
+            if (description := SELECT_ENTITIES_BY_AP.get(ap))
+        )
+
+    for subentry_id, subentry_entities in entities.items():
+        async_add_entities(subentry_entities, config_subentry_id=subentry_id)
 
 
 class AiriosSelectEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
@@ -106,42 +121,48 @@ class AiriosSelectEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
         super().__init__(description.key, coordinator, modbus_address, subentry)
         self.entity_description = description  # type: ignore[override]
         self._attr_current_option = None
+        self._value_fn = description.value_fn
 
     async def _select_option_internal(self, option: str) -> bool:
         if option == self.current_option:
             return False
 
         try:
-            dev = await self.api().node(self.modbus_address)
+            dev = await self.device()
             ret = await self.entity_description.set_value_fn(dev, option)
         except AiriosException as ex:
+            self.invalidate_device()
             msg = f"Failed to set {self.entity_description.key} to {option}"
             raise HomeAssistantError(msg) from ex
         return ret
 
     async def async_select_option(self, option: str) -> None:
         """Change the selected option."""
-        update_needed = await self._select_option_internal(option)
-        if update_needed:
-            await self.coordinator.async_request_refresh()
+        if (value := self.entity_description.option_value_fn(option)) is None:
+            msg = f"Invalid option {option} for {self.entity_description.key}"
+            raise HomeAssistantError(msg)
+        if await self._select_option_internal(option):
+            self.apply_value(value)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle update data from the coordinator."""
         try:
             result = self.fetch_result()
-            self._attr_current_option = self.entity_description.value_fn(result.value)
+            self._attr_current_option = self._value_fn(result.value)
             self._attr_available = self._attr_current_option is not None
+            self._stale_polls = 0
             if result.status is not None:
                 self.set_extra_state_attributes_internal(result.status)
         except (TypeError, ValueError) as ex:
             _LOGGER.info(
                 "Failed to update select entity for node=%s, property=%s: %s",
-                f"0x{self.rf_address:08X}",
+                self._rf_address_hex,
                 self.entity_description.key,
                 ex,
             )
-            self._attr_current_option = None
-            self._attr_available = False
+            if self._attr_current_option is None or not self.keep_stale_state():
+                self._attr_current_option = None
+                self._attr_available = False
         finally:
-            self.async_write_ha_state()
+            self.async_write_ha_state_if_changed(self._attr_current_option)
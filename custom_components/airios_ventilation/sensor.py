@@ -3,9 +3,9 @@
 from __future__ import annotations
 
 import logging
-import typing
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -39,16 +39,18 @@ from pyairios.properties import (
 from .entity import (
     AiriosEntity,
     AiriosEntityDescription,
-    find_matching_subentry,
+    entity_key,
+    subentries_by_address,
 )
 
-if typing.TYPE_CHECKING:
+if TYPE_CHECKING:
     from collections.abc import Callable
-    from datetime import timedelta
+    from typing import Any
 
     from homeassistant.config_entries import ConfigEntry, ConfigSubentry
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
     from homeassistant.helpers.typing import StateType
+    from pyairios.properties import AiriosBaseProperty
 
     from .coordinator import AiriosDataUpdateCoordinator
 
@@ -79,16 +81,6 @@ VMD_ERROR_CODE_MAP: dict[VMDErrorCode, str] = {
 }
 
 
-def power_on_time_value_fn(v: timedelta) -> StateType:
-    """Convert timedelta to sensor's value."""
-    return v.total_seconds()
-
-
-def error_code_value_fn(v: VMDErrorCode) -> StateType:
-    """Convert VMDErrorCode to sensor's value."""
-    return VMD_ERROR_CODE_MAP.get(v)
-
-
 def temperature_value_fn(v: VMDTemperature) -> StateType:
     """Convert VMDTemperature to sensor's value."""
     if v.status == VMDSensorStatus.OK:
@@ -127,7 +119,7 @@ def postheater_value_fn(v: VMDHeater) -> StateType:
 SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
     AiriosSensorEntityDescription(
         ap=AiriosBridgeProperty.RF_LOAD_LAST_HOUR,
-        key=AiriosBridgeProperty.RF_LOAD_LAST_HOUR.name.casefold(),
+        key=entity_key(AiriosBridgeProperty.RF_LOAD_LAST_HOUR),
         translation_key="rf_load_last_hour",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
@@ -137,7 +129,7 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
     ),
     AiriosSensorEntityDescription(
         ap=AiriosBridgeProperty.RF_LOAD_CURRENT_HOUR,
-        key=AiriosBridgeProperty.RF_LOAD_CURRENT_HOUR.name.casefold(),
+        key=entity_key(AiriosBridgeProperty.RF_LOAD_CURRENT_HOUR),
         translation_key="rf_load_current_hour",
         native_unit_of_measurement=PERCENTAGE,
         state_class=SensorStateClass.MEASUREMENT,
@@ -146,7 +138,7 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
     ),
     AiriosSensorEntityDescription(
         ap=AiriosBridgeProperty.MESSAGES_SEND_LAST_HOUR,
-        key=AiriosBridgeProperty.MESSAGES_SEND_LAST_HOUR.name.casefold(),
+        key=entity_key(AiriosBridgeProperty.MESSAGES_SEND_LAST_HOUR),
         translation_key="rf_sent_messages_last_hour",
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_category=EntityCategory.DIAGNOSTIC,
@@ -154,14 +146,14 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
     ),
     AiriosSensorEntityDescription(
         ap=AiriosBridgeProperty.MESSAGES_SEND_CURRENT_HOUR,
-        key=AiriosBridgeProperty.MESSAGES_SEND_CURRENT_HOUR.name.casefold(),
+        key=entity_key(AiriosBridgeProperty.MESSAGES_SEND_CURRENT_HOUR),
         translation_key="rf_sent_messages_current_hour",
         state_class=SensorStateClass.TOTAL_INCREASING,
         entity_category=EntityCategory.DIAGNOSTIC,
     ),
     AiriosSensorEntityDescription(
         ap=AiriosBridgeProperty.UPTIME,
-        key=AiriosBridgeProperty.UPTIME.name.casefold(),
+        key=entity_key(AiriosBridgeProperty.UPTIME),
         translation_key="power_on_time",
         entity_category=EntityCategory.DIAGNOSTIC,
         device_class=SensorDeviceClass.DURATION,
@@ -171,7 +163,7 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
     ),
     AiriosSensorEntityDescription(
         ap=AiriosVMDProperty.TEMPERATURE_EXHAUST,
-        key=AiriosVMDProperty.TEMPERATURE_EXHAUST.name.casefold(),
+        key=entity_key(AiriosVMDProperty.TEMPERATURE_EXHAUST),
         translation_key="indoor_air_temperature",
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
@@ -181,7 +173,7 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
     ),
     AiriosSensorEntityDescription(
         ap=AiriosVMDProperty.TEMPERATURE_INLET,
-        key=AiriosVMDProperty.TEMPERATURE_INLET.name.casefold(),
+        key=entity_key(AiriosVMDProperty.TEMPERATURE_INLET),
         translation_key="outdoor_air_temperature",
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
@@ -191,7 +183,7 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
     ),
     AiriosSensorEntityDescription(
         ap=AiriosVMDProperty.TEMPERATURE_OUTLET,
-        key=AiriosVMDProperty.TEMPERATURE_OUTLET.name.casefold(),
+        key=entity_key(AiriosVMDProperty.TEMPERATURE_OUTLET),
         translation_key="exhaust_air_temperature",
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
@@ -201,7 +193,7 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
     ),
     AiriosSensorEntityDescription(
         ap=AiriosVMDProperty.TEMPERATURE_SUPPLY,
-        key=AiriosVMDProperty.TEMPERATURE_SUPPLY.name.casefold(),
+        key=entity_key(AiriosVMDProperty.TEMPERATURE_SUPPLY),
         translation_key="supply_air_temperature",
         state_class=SensorStateClass.MEASUREMENT,
         device_class=SensorDeviceClass.TEMPERATURE,
@@ -211,7 +203,7 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
     ),
     AiriosSensorEntityDescription(
         ap=AiriosVMDProperty.FAN_RPM_EXHAUST,
-        key=AiriosVMDProperty.FAN_RPM_EXHAUST.name.casefold(),
+        key=entity_key(AiriosVMDProperty.FAN_RPM_EXHAUST),
         translation_key="exhaust_fan_rpm",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=REVOLUTIONS_PER_MINUTE,
@@ -219,7 +211,7 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
     ),
     AiriosSensorEntityDescription(
         ap=AiriosVMDProperty.FAN_RPM_SUPPLY,
-        key=AiriosVMDProperty.FAN_RPM_SUPPLY.name.casefold(),
+        key=entity_key(AiriosVMDProperty.FAN_RPM_SUPPLY),
         translation_key="supply_fan_rpm",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=REVOLUTIONS_PER_MINUTE,
@@ -227,7 +219,7 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
     ),
     AiriosSensorEntityDescription(
         ap=AiriosVMDProperty.FAN_SPEED_SUPPLY,
-        key=AiriosVMDProperty.FAN_SPEED_SUPPLY.name.casefold(),
+        key=entity_key(AiriosVMDProperty.FAN_SPEED_SUPPLY),
         translation_key="supply_fan_speed",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
@@ -235,7 +227,7 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
     ),
     AiriosSensorEntityDescription(
         ap=AiriosVMDProperty.FAN_SPEED_EXHAUST,
-        key=AiriosVMDProperty.FAN_SPEED_EXHAUST.name.casefold(),
+        key=entity_key(AiriosVMDProperty.FAN_SPEED_EXHAUST),
         translation_key="exhaust_fan_speed",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
@@ -243,16 +235,16 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
     ),
     AiriosSensorEntityDescription(
         ap=AiriosVMDProperty.ERROR_CODE,
-        key=AiriosVMDProperty.ERROR_CODE.name.casefold(),
+        key=entity_key(AiriosVMDProperty.ERROR_CODE),
         translation_key="error_code",
         entity_category=EntityCategory.DIAGNOSTIC,
         device_class=SensorDeviceClass.ENUM,
         options=list(dict.fromkeys(VMD_ERROR_CODE_MAP.values())),
-        value_fn=error_code_value_fn,
+        value_fn=VMD_ERROR_CODE_MAP.get,
     ),
     AiriosSensorEntityDescription(
         ap=AiriosVMDProperty.FILTER_DURATION,
-        key=AiriosVMDProperty.FILTER_DURATION.name.casefold(),
+        key=entity_key(AiriosVMDProperty.FILTER_DURATION),
         translation_key="filter_duration_days",
         native_unit_of_measurement=UnitOfTime.DAYS,
         device_class=SensorDeviceClass.DURATION,
@@ -261,7 +253,7 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
     ),
     AiriosSensorEntityDescription(
         ap=AiriosVMDProperty.FILTER_REMAINING_PERCENT,
-        key=AiriosVMDProperty.FILTER_REMAINING_PERCENT.name.casefold(),
+        key=entity_key(AiriosVMDProperty.FILTER_REMAINING_PERCENT),
         translation_key="filter_remaining_percent",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
@@ -269,7 +261,7 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
     ),
     AiriosSensorEntityDescription(
         ap=AiriosVMDProperty.BYPASS_POSITION,
-        key=AiriosVMDProperty.BYPASS_POSITION.name.casefold(),
+        key=entity_key(AiriosVMDProperty.BYPASS_POSITION),
         translation_key="bypass_position",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
@@ -277,7 +269,7 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
     ),
     AiriosSensorEntityDescription(
         ap=AiriosVMDProperty.POSTHEATER,
-        key=AiriosVMDProperty.POSTHEATER.name.casefold(),
+        key=entity_key(AiriosVMDProperty.POSTHEATER),
         translation_key="postheater",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=PERCENTAGE,
@@ -285,7 +277,7 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
     ),
     AiriosSensorEntityDescription(
         ap=AiriosVMDProperty.VENTILATION_SPEED_OVERRIDE_REMAINING_TIME,
-        key=AiriosVMDProperty.VENTILATION_SPEED_OVERRIDE_REMAINING_TIME.name.casefold(),
+        key=entity_key(AiriosVMDProperty.VENTILATION_SPEED_OVERRIDE_REMAINING_TIME),
         translation_key="override_remaining_time",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=UnitOfTime.MINUTES,
@@ -294,7 +286,7 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
     # VMD07-RP13 specific
     AiriosSensorEntityDescription(
         ap=AiriosVMDProperty.CO2_LEVEL,
-        key=AiriosVMDProperty.CO2_LEVEL.name.casefold(),
+        key=entity_key(AiriosVMDProperty.CO2_LEVEL),
         translation_key="co2_level",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
@@ -302,7 +294,7 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
     ),
     AiriosSensorEntityDescription(
         ap=AiriosVMDProperty.CO2_CONTROL_SETPOINT,
-        key=AiriosVMDProperty.CO2_CONTROL_SETPOINT.name.casefold(),
+        key=entity_key(AiriosVMDProperty.CO2_CONTROL_SETPOINT),
         translation_key="co2_setpoint",
         state_class=SensorStateClass.MEASUREMENT,
         native_unit_of_measurement=CONCENTRATION_PARTS_PER_MILLION,
@@ -310,6 +302,10 @@ SENSOR_ENTITIES: tuple[AiriosSensorEntityDescription, ...] = (
     ),
 )
 
+SENSOR_ENTITIES_BY_AP: dict[AiriosBaseProperty, AiriosSensorEntityDescription] = {
+    description.ap: description for description in SENSOR_ENTITIES
+}
+
 
 class AiriosSensorEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
     AiriosEntity,
@@ -329,30 +325,33 @@ class AiriosSensorEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
         """Initialize the Airios sensor entity."""
         super().__init__(description.key, coordinator, modbus_address, subentry)
         self.entity_description = description  # type: ignore[override]
+        self._value_fn = description.value_fn
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle update data from the coordinator."""
         try:
             result = self.fetch_result()
-            if self.entity_description.value_fn:
-                self._attr_native_value = self.entity_description.value_fn(result.value)
-            else:
-                self._attr_native_value = result.value
+            value_fn = self._value_fn
+            self._attr_native_value = (
+                value_fn(result.value) if value_fn is not None else result.value
+            )
             self._attr_available = self._attr_native_value is not None
+            self._stale_polls = 0
             if result.status is not None:
                 self.set_extra_state_attributes_internal(result.status)
         except (TypeError, ValueError) as ex:
             _LOGGER.info(
                 "Failed to update sensor entity for node=%s, property=%s: %s",
-                f"0x{self.rf_address:08X}",
+                self._rf_address_hex,
                 self.entity_description.key,
                 ex,
             )
-            self._attr_native_value = None
-            self._attr_available = False
+            if self._attr_native_value is None or not self.keep_stale_state():
+                self._attr_native_value = None
+                self._attr_available = False
         finally:
-            self.async_write_ha_state()
+            self.async_write_ha_state_if_changed(self._attr_native_value)
 
 
 async def async_setup_entry(
@@ -362,13 +361,19 @@ async def async_setup_entry(
 ) -> None:
     """Set up the sensors."""
     coordinator: AiriosDataUpdateCoordinator = entry.runtime_data
+    subentries = subentries_by_address(entry)
 
+    entities: dict[str | None, list[AiriosSensorEntity]] = defaultdict(list)
     for modbus_address, node in coordinator.data.nodes.items():
-        subentry = find_matching_subentry(entry, modbus_address)
-        entities: list[AiriosSensorEntity] = [
-            AiriosSensorEntity(description, coordinator, modbus_address, subentry)
-            for description in SENSOR_ENTITIES
-            if description.ap in node
-        ]
+        if SENSOR_ENTITIES_BY_AP.keys().isdisjoint(node):
+            continue
+        subentry = subentries.get(modbus_address)
         subentry_id = subentry.subentry_id if subentry else None
-        async_add_entities(entities, config_subentry_id=subentry_id)
+        entities[subentry_id].extend(
+            AiriosSensorEntity(description, coordinator, modbus_address, subentry)
+            for ap in node
+            if (description := SENSOR_ENTITIES_BY_AP.get(ap))
+        )
+
+    for subentry_id, subentry_entities in entities.items():
+        async_add_entities(subentry_entities, config_subentry_id=subentry_id)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import typing
+from typing import TYPE_CHECKING
 
 import voluptuous as vol
 from homeassistant.components.fan import ATTR_PRESET_MODE
@@ -16,7 +16,7 @@ from pyairios.constants import ResetMode
 
 from .const import DOMAIN
 
-if typing.TYPE_CHECKING:
+if TYPE_CHECKING:
     from pyairios.models.brdg_02r13 import BRDG02R13
 
     from .coordinator import AiriosDataUpdateCoordinator
@@ -27,18 +27,24 @@ ATTR_PRESET_OVERRIDE_TIME = "preset_override_time"
 
 SERVICE_SCHEMA_SET_PRESET_FAN_SPEED = make_entity_service_schema(
     {
-        vol.Required(ATTR_SUPPLY_FAN_SPEED): vol.All(vol.Coerce(int)),
-        vol.Required(ATTR_EXHAUST_FAN_SPEED): vol.All(vol.Coerce(int)),
+        vol.Required(ATTR_SUPPLY_FAN_SPEED): vol.Coerce(int),
+        vol.Required(ATTR_EXHAUST_FAN_SPEED): vol.Coerce(int),
     }
 )
 
 SERVICE_SCHEMA_SET_PRESET_MODE_DURATION = make_entity_service_schema(
     {
         vol.Required(ATTR_PRESET_MODE): vol.In(["low", "medium", "high"]),
-        vol.Required(ATTR_PRESET_OVERRIDE_TIME): vol.All(vol.Coerce(int)),
+        vol.Required(ATTR_PRESET_OVERRIDE_TIME): vol.Coerce(int),
     }
 )
 
+SERVICE_SCHEMA_RESET = vol.Schema(
+    {
+        vol.Required(ATTR_DEVICE_ID): str,
+    },
+)
+
 SERVICE_SET_PRESET_FAN_SPEED_AWAY = "set_preset_fan_speed_away"
 SERVICE_SET_PRESET_FAN_SPEED_LOW = "set_preset_fan_speed_low"
 SERVICE_SET_PRESET_FAN_SPEED_MEDIUM = "set_preset_fan_speed_medium"
@@ -50,8 +56,9 @@ SERVICE_FACTORY_RESET = "factory_reset"
 
 
 async def _get_api_device(service_call: ServiceCall) -> BRDG02R13:
+    hass = service_call.hass
     service_data = service_call.data
-    device_registry = dr.async_get(service_call.hass)
+    device_registry = dr.async_get(hass)
     if not (device := device_registry.async_get(service_data[ATTR_DEVICE_ID])):
         raise ServiceValidationError(
             translation_domain=DOMAIN,
@@ -59,40 +66,43 @@ async def _get_api_device(service_call: ServiceCall) -> BRDG02R13:
             translation_placeholders={"service_name": "device_reset"},
         )
 
-    config_entry = None
-    for entry_id in device.config_entries:
-        config_entry = service_call.hass.config_entries.async_get_entry(entry_id)
-        if config_entry is not None and config_entry.domain == DOMAIN:
-            break
-
-    if (
-        config_entry is None
-        or device is None
-        or config_entry.state != ConfigEntryState.LOADED
-    ):
+    get_entry = hass.config_entries.async_get_entry
+    config_entry = next(
+        (
+            entry
+            for entry_id in device.config_entries
+            if (entry := get_entry(entry_id)) is not None
+            and entry.domain == DOMAIN
+            and entry.state is ConfigEntryState.LOADED
+        ),
+        None,
+    )
+    if config_entry is None:
         raise ServiceValidationError(
             translation_domain=DOMAIN,
             translation_key="invalid_config_entry",
             translation_placeholders={"service_name": "device_reset"},
         )
 
-    rf_address = None
-    for dev_id in (
-        device.identifiers if isinstance(device, dr.DeviceEntry) else {device}
-    ):
-        if dev_id[0] == DOMAIN:
-            rf_address = int(dev_id[1])
-
-    if not rf_address:
+    rf_address = next(
+        (
+            int(identifier)
+            for domain, identifier in device.identifiers
+            if domain == DOMAIN
+        ),
+        None,
+    )
+    if rf_address is None:
         raise ServiceValidationError(
             translation_domain=DOMAIN,
             translation_key="invalid_device_entry",
             translation_placeholders={"service_name": "device_reset"},
         )
 
+    # The bridge RF address is validated at setup, use it instead of issuing
+    # another Modbus read.
     coordinator: AiriosDataUpdateCoordinator = config_entry.runtime_data
-    bridge = coordinator.api.bridge
-    if (result := await bridge.device_rf_address()) and result.value != rf_address:
+    if rf_address != coordinator.bridge_rf_address:
         raise ServiceValidationError(
             translation_domain=DOMAIN,
             translation_key="invalid_bridge_rf_address",
@@ -122,20 +132,12 @@ def async_setup_services(hass: HomeAssistant) -> None:
     hass.services.async_register(
         domain=DOMAIN,
         service=SERVICE_DEVICE_RESET,
-        schema=vol.Schema(
-            {
-                vol.Required(ATTR_DEVICE_ID): str,
-            },
-        ),
+        schema=SERVICE_SCHEMA_RESET,
         service_func=handle_device_reset_call,
     )
     hass.services.async_register(
         domain=DOMAIN,
         service=SERVICE_FACTORY_RESET,
-        schema=vol.Schema(
-            {
-                vol.Required(ATTR_DEVICE_ID): str,
-            },
-        ),
+        schema=SERVICE_SCHEMA_RESET,
         service_func=handle_factory_reset_call,
     )
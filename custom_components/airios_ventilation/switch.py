@@ -3,29 +3,33 @@
 from __future__ import annotations
 
 import logging
-import typing
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.switch import (
     SwitchEntity,
     SwitchEntityDescription,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from pyairios.exceptions import AiriosException
 from pyairios.properties import AiriosVMDProperty
 
 from .entity import (
     AiriosEntity,
     AiriosEntityDescription,
-    find_matching_subentry,
+    entity_key,
+    subentries_by_address,
 )
 
-if typing.TYPE_CHECKING:
+if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
     from homeassistant.config_entries import ConfigEntry, ConfigSubentry
     from homeassistant.helpers.entity_platform import AddConfigEntryEntitiesCallback
     from pyairios.device import AiriosDevice
+    from pyairios.properties import AiriosBaseProperty
 
     from .coordinator import AiriosDataUpdateCoordinator
 
@@ -48,12 +52,16 @@ class AiriosSwitchEntityDescription(AiriosEntityDescription, SwitchEntityDescrip
 SWITCH_ENTITIES: tuple[AiriosSwitchEntityDescription, ...] = (
     AiriosSwitchEntityDescription(
         ap=AiriosVMDProperty.BASIC_VENTILATION_ENABLE,
-        key=AiriosVMDProperty.BASIC_VENTILATION_ENABLE.name.casefold(),
+        key=entity_key(AiriosVMDProperty.BASIC_VENTILATION_ENABLE),
         translation_key="basic_vent_enable_sw",
         set_value_fn=_base_vent_switch,
     ),
 )
 
+SWITCH_ENTITIES_BY_AP: dict[AiriosBaseProperty, AiriosSwitchEntityDescription] = {
+    description.ap: description for description in SWITCH_ENTITIES
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,  # noqa: ARG001 # pylint: disable=unused-argument
@@ -62,16 +70,22 @@ async def async_setup_entry(
 ) -> None:
     """Set up the switches."""
     coordinator: AiriosDataUpdateCoordinator = entry.runtime_data
+    subentries = subentries_by_address(entry)
 
+    entities: dict[str | None, list[AiriosSwitchEntity]] = defaultdict(list)
     for modbus_address, node in coordinator.data.nodes.items():
-        subentry = find_matching_subentry(entry, modbus_address)
-        entities: list[AiriosSwitchEntity] = [
-            AiriosSwitchEntity(description, coordinator, modbus_address, subentry)
-            for description in SWITCH_ENTITIES
-            if description.ap in node
-        ]
+        if SWITCH_ENTITIES_BY_AP.keys().isdisjoint(node):
+            continue
+        subentry = subentries.get(modbus_address)
         subentry_id = subentry.subentry_id if subentry else None
-        async_add_entities(entities, config_subentry_id=subentry_id)
+        entities[subentry_id].extend(
+            AiriosSwitchEntity(description, coordinator, modbus_address, subentry)
+            for ap in node
+            if (description := SWITCH_ENTITIES_BY_AP.get(ap))
+        )
+
+    for subentry_id, subentry_entities in entities.items():
+        async_add_entities(subentry_entities, config_subentry_id=subentry_id)
 
 
 class AiriosSwitchEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
@@ -94,10 +108,13 @@ class AiriosSwitchEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
         self.entity_description = description  # type: ignore[override]
 
     async def _set_value_internal(self, value: int) -> bool:
-        if self.entity_description.set_value_fn is None:
-            raise NotImplementedError
-        dev = await self.api().node(self.modbus_address)
-        return await self.entity_description.set_value_fn(dev, value)
+        try:
+            dev = await self.device()
+            return await self.entity_description.set_value_fn(dev, value)
+        except AiriosException as ex:
+            self.invalidate_device()
+            msg = f"Failed to set {self.entity_description.key} to {value}"
+            raise HomeAssistantError(msg) from ex
 
     async def async_turn_on(
         self,
@@ -105,9 +122,8 @@ class AiriosSwitchEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
     ) -> None:
         """Handle switch on."""
         _LOGGER.debug("Switch %s turned On", self.entity_description.name)
-        update_needed = await self._set_value_internal(1)
-        if update_needed:
-            await self.coordinator.async_request_refresh()
+        if await self._set_value_internal(1):
+            self.apply_value(1)
 
     async def async_turn_off(
         self,
@@ -115,27 +131,26 @@ class AiriosSwitchEntity(  # pyright: ignore[reportIncompatibleVariableOverride]
     ) -> None:
         """Handle switch off."""
         _LOGGER.debug("Switch %s turned Off", self.entity_description.name)
-        update_needed = await self._set_value_internal(0)
-        if update_needed:
-            await self.coordinator.async_request_refresh()
+        if await self._set_value_internal(0):
+            self.apply_value(0)
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Handle update data from the coordinator."""
-        try:
-            result = self.fetch_result()
-            self._attr_is_on = result.value
-            self._attr_available = self._attr_is_on is not None
-            if result.status is not None:
-                self.set_extra_state_attributes_internal(result.status)
-        except (TypeError, ValueError) as ex:
+        if (result := self.get_result()) is None:
             _LOGGER.info(
-                "Failed to update switch entity for node=%s, property=%s: %s",
-                f"0x{self.rf_address:08X}",
+                "Failed to update switch entity for node=%s, property=%s: "
+                "result not exists",
+                self._rf_address_hex,
                 self.entity_description.key,
-                ex,
             )
-            self._attr_is_on = None
-            self._attr_available = False
-        finally:
-            self.async_write_ha_state()
+            if self._attr_is_on is None or not self.keep_stale_state():
+                self._attr_is_on = None
+                self._attr_available = False
+        else:
+            self._attr_is_on = result.value
+            self._attr_available = True
+            self._stale_polls = 0
+            if result.status is not None:
+                self.set_extra_state_attributes_internal(result.status)
+        self.async_write_ha_state_if_changed(self._attr_is_on)
@@ -0,0 +1,119 @@
+"""Tests for the Airios number entities."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, cast
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from homeassistant.helpers.device_registry import DeviceInfo
+from pyairios.properties import AiriosVMDProperty
+from pyairios.registers import Result
+
+from custom_components.airios_ventilation.number import (
+    NUMBER_ENTITIES_BY_AP,
+    AiriosNumberEntity,
+)
+
+MODBUS_ADDRESS = 2
+AP = AiriosVMDProperty.PREHEATER_SETPOINT
+
+
+def _make_entity(stale_grace: int) -> tuple[AiriosNumberEntity, dict[Any, Result]]:
+    """Return a number entity and the coordinator data of its node."""
+    node: dict[Any, Result] = {AP: Result(10.0)}
+    coordinator = MagicMock()
+    coordinator.stale_grace = stale_grace
+    coordinator.data.nodes = {MODBUS_ADDRESS: node}
+    coordinator.node_info = {MODBUS_ADDRESS: (0x123456, "0x123456", DeviceInfo())}
+    entity = AiriosNumberEntity(
+        NUMBER_ENTITIES_BY_AP[AP], coordinator, MODBUS_ADDRESS, None
+    )
+    entity.async_write_ha_state = MagicMock()  # type: ignore[method-assign]
+    entity._handle_coordinator_update()
+    return entity, node
+
+
+def _writes(entity: AiriosNumberEntity) -> int:
+    """Return the number of state writes of the entity."""
+    return cast("MagicMock", entity.async_write_ha_state).call_count
+
+
+@pytest.mark.parametrize("stale_grace", [0, 1, 3])
+def test_value_cleared_after_stale_grace(stale_grace: int) -> None:
+    """The value is kept for stale_grace failed polls and cleared on the next one."""
+    entity, node = _make_entity(stale_grace)
+    assert entity.native_value == 10.0
+
+    del node[AP]
+    for _ in range(stale_grace):
+        entity._handle_coordinator_update()
+        assert entity.native_value == 10.0
+
+    entity._handle_coordinator_update()
+    assert entity.native_value is None
+
+
+def test_unchanged_update_not_written() -> None:
+    """A poll with the same value does not write the state again."""
+    entity, node = _make_entity(0)
+    entity._handle_coordinator_update()
+    assert _writes(entity) == 1
+
+    node[AP] = Result(12.0)
+    entity._handle_coordinator_update()
+    assert entity.native_value == 12.0
+    assert _writes(entity) == 2
+
+
+def test_failed_read_clears_value() -> None:
+    """Without a grace period, a failed read clears the value right away."""
+    entity, node = _make_entity(0)
+
+    node[AP] = Result(None)
+    entity._handle_coordinator_update()
+    assert entity.native_value is None
+    assert _writes(entity) == 2
+
+
+def test_repeated_failures_written_once() -> None:
+    """Once the grace period ran out, the cleared state is written only once."""
+    entity, node = _make_entity(1)
+
+    del node[AP]
+    for _ in range(5):
+        entity._handle_coordinator_update()
+    assert entity.native_value is None
+    assert _writes(entity) == 2
+
+
+def test_value_restored_after_failed_read() -> None:
+    """The error path clears the value and the next successful read restores it."""
+    entity, node = _make_entity(0)
+
+    del node[AP]
+    entity._handle_coordinator_update()
+    assert entity.native_value is None
+
+    node[AP] = Result(11.0)
+    entity._handle_coordinator_update()
+    assert entity.native_value == 11.0
+
+
+def test_stale_value_written_again() -> None:
+    """Writing the value kept during the grace period still reaches the device."""
+    entity, node = _make_entity(1)
+    dev = MagicMock()
+    dev.set = AsyncMock(return_value=True)
+    entity.device = AsyncMock(return_value=dev)  # type: ignore[method-assign]
+
+    asyncio.run(entity._set_value_internal(10.0))
+    dev.set.assert_not_awaited()
+
+    del node[AP]
+    entity._handle_coordinator_update()
+    assert entity.native_value == 10.0
+
+    asyncio.run(entity._set_value_internal(10.0))
+    dev.set.assert_awaited_once_with(AP, 10.0)